@@ -17,4 +17,10 @@ setup(
         "numpy>=1.23.0",
         "regex>=2022.10.31",
     ],
+    extras_require={
+        # Linear-time regex engine for the JavaScript extractor
+        "re2": ["google-re2>=1.1"],
+        # Faster, abbreviation-aware sentence splitting for the Chunker
+        "nupunkt": ["nupunkt>=0.5"],
+    },
 )
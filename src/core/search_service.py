@@ -129,7 +129,7 @@ class SearchService:
             True if index was loaded successfully
         """
         try:
-            return self.engine._load_index()
+            return self.engine.load_index()
         except Exception as e:
             logger.error(f"Failed to load index: {str(e)}")
             return False
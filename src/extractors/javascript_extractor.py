@@ -2,45 +2,115 @@
 
 import re
 import logging
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Set, Pattern
 from src.extractors.base_extractor import BaseExtractor
 
+try:
+    import re2  # type: ignore
+except ImportError:
+    # google-re2 is optional; the standard library engine is used without it
+    re2 = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# re flags that have an inline equivalent understood by both re and RE2
+_INLINE_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s"}
+
+
+def _compile(pattern: str, flags: int = 0) -> Pattern[str]:
+    """
+    Compile a pattern with RE2 when available, falling back to re.
+
+    RE2 matches in linear time, so the lazy ``[\\s\\S]*?`` bodies below
+    cannot backtrack catastrophically on large files. Patterns RE2 does
+    not support are compiled with the standard library instead. Flags are
+    applied as an inline group, so both engines see the same pattern.
+
+    Args:
+        pattern: Regular expression
+        flags: Combination of re.IGNORECASE, re.MULTILINE and re.DOTALL
+
+    Returns:
+        Compiled pattern
+
+    Raises:
+        ValueError: If flags contains any other flag
+    """
+    unsupported = flags
+    inline = ""
+    for flag, letter in _INLINE_FLAGS.items():
+        if flags & flag:
+            inline += letter
+            unsupported &= ~flag
+    if unsupported:
+        raise ValueError(f"Unsupported regex flags: {re.RegexFlag(unsupported)!r}")
+
+    if inline:
+        pattern = f"(?{inline}){pattern}"
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+# Regex patterns for JavaScript extraction, compiled once at import time
+_FUNCTION_RE = _compile(
+    r"(?:export\s+)?(?:async\s+)?(?:function\s+)?(?P<name>[a-zA-Z_$][a-zA-Z0-9_$]*)\s*(?P<params>\([^)]*\))\s*(?P<body>\{[\s\S]*?\})",
+    re.MULTILINE,
+)
+_CLASS_RE = _compile(
+    r"(?:export\s+)?class\s+(?P<name>[a-zA-Z_$][a-zA-Z0-9_$]*)(?:\s+extends\s+(?P<extends>[a-zA-Z_$][a-zA-Z0-9_$.]*))?(?P<body>\s*\{[\s\S]*?\})",
+    re.MULTILINE,
+)
+_METHOD_RE = _compile(
+    r"(?:async\s+)?(?P<name>[a-zA-Z_$][a-zA-Z0-9_$]*)\s*(?P<params>\([^)]*\))\s*(?P<body>\{[\s\S]*?\})",
+    re.MULTILINE,
+)
+_ARROW_FUNCTION_RE = _compile(
+    r"(?:export\s+)?(?:const|let|var)\s+(?P<name>[a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*(?:async\s+)?(?P<params>(?:\([^)]*\)|[a-zA-Z_$][a-zA-Z0-9_$]*))\s*=>\s*(?:(?P<body>\{[\s\S]*?\})|(?P<expression>[^;{]*?(?:;|\n)))",
+    re.MULTILINE,
+)
+_IMPORT_RE = _compile(
+    r"import\s+(?:(?P<default>[a-zA-Z_$][a-zA-Z0-9_$]*)\s*,?\s*)?(?:\{\s*(?P<named>[^}]*)\s*\})?\s*from\s*['\"](?P<source>[^'\"]*)['\"]",
+    re.MULTILINE,
+)
+_JSX_COMPONENT_RE = _compile(
+    r"(?:export\s+)?(?:function|const)\s+(?P<name>[A-Z][a-zA-Z0-9_$]*)\s*(?:=\s*)?(?P<params>\([^)]*\))\s*(?:=>\s*)?(?P<body>\{[\s\S]*?\}|<[\s\S]*?>(?:[\s\S]*?)<\/[a-zA-Z_$][a-zA-Z0-9_$]*>)",
+    re.MULTILINE,
+)
+_JSDOC_RE = _compile(r"/\*\*(?P<content>[\s\S]*?)\*/", re.MULTILINE)
+
+# JSDoc tag patterns
+_JSDOC_PARAM_RE = _compile(
+    r"@param\s+(?:{(?P<type>[^}]*)})?\s*(?P<n>[^\s]+)?\s*(?P<desc>.*)?"
+)
+_JSDOC_RETURNS_RE = _compile(r"@returns?\s+(?:{(?P<type>[^}]*)})?\s*(?P<desc>.*)?")
+_JSDOC_THROWS_RE = _compile(r"@throws?\s+(?:{(?P<type>[^}]*)})?\s*(?P<desc>.*)?")
+
+# Helper patterns for JSX elements, parameters and readable names
+_JSX_ELEMENT_RE = _compile(r"<([A-Z][a-zA-Z0-9_$]*)(?:\s|/|>)")
+_PARAM_RE = _compile(r"(?:{[^}]*}|\[[^\]]*]|[^,]+)(?:,|$)")
+_CAMEL_CASE_RE = re.compile(r"([a-z0-9])([A-Z])")
+
+
 class JavaScriptExtractor(BaseExtractor):
     """Class for extracting information from JavaScript files."""
 
     def __init__(self):
         """Initialize the JavaScript extractor."""
         # Regex patterns for JavaScript extraction
-        self.function_pattern = re.compile(
-            r"(?:export\s+)?(?:async\s+)?(?:function\s+)?(?P<name>[a-zA-Z_$][a-zA-Z0-9_$]*)\s*(?P<params>\([^)]*\))\s*(?P<body>\{[\s\S]*?\})",
-            re.MULTILINE,
-        )
-        self.class_pattern = re.compile(
-            r"(?:export\s+)?class\s+(?P<name>[a-zA-Z_$][a-zA-Z0-9_$]*)(?:\s+extends\s+(?P<extends>[a-zA-Z_$][a-zA-Z0-9_$.]*))?(?P<body>\s*\{[\s\S]*?\})",
-            re.MULTILINE,
-        )
-        self.method_pattern = re.compile(
-            r"(?:async\s+)?(?P<name>[a-zA-Z_$][a-zA-Z0-9_$]*)\s*(?P<params>\([^)]*\))\s*(?P<body>\{[\s\S]*?\})",
-            re.MULTILINE,
-        )
-        self.arrow_function_pattern = re.compile(
-            r"(?:export\s+)?(?:const|let|var)\s+(?P<name>[a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*(?:async\s+)?(?P<params>(?:\([^)]*\)|[a-zA-Z_$][a-zA-Z0-9_$]*))\s*=>\s*(?:(?P<body>\{[\s\S]*?\})|(?P<expression>[^;{]*?(?:;|\n)))",
-            re.MULTILINE,
-        )
-        self.import_pattern = re.compile(
-            r"import\s+(?:(?P<default>[a-zA-Z_$][a-zA-Z0-9_$]*)\s*,?\s*)?(?:\{\s*(?P<named>[^}]*)\s*\})?\s*from\s*['\"](?P<source>[^'\"]*)['\"]",
-            re.MULTILINE,
-        )
-        self.jsx_component_pattern = re.compile(
-            r"(?:export\s+)?(?:function|const)\s+(?P<name>[A-Z][a-zA-Z0-9_$]*)\s*(?:=\s*)?(?P<params>\([^)]*\))\s*(?:=>\s*)?(?P<body>\{[\s\S]*?\}|<[\s\S]*?>(?:[\s\S]*?)<\/[a-zA-Z_$][a-zA-Z0-9_$]*>)",
-            re.MULTILINE,
-        )
-        self.jsdoc_pattern = re.compile(r"/\*\*(?P<content>[\s\S]*?)\*/", re.MULTILINE)
+        self.function_pattern = _FUNCTION_RE
+        self.class_pattern = _CLASS_RE
+        self.method_pattern = _METHOD_RE
+        self.arrow_function_pattern = _ARROW_FUNCTION_RE
+        self.import_pattern = _IMPORT_RE
+        self.jsx_component_pattern = _JSX_COMPONENT_RE
+        self.jsdoc_pattern = _JSDOC_RE
 
     def extract_from_file(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -191,10 +261,7 @@ class JavaScriptExtractor(BaseExtractor):
             if line.startswith("@"):
                 # Handle tags
                 if line.startswith("@param"):
-                    param_match = re.match(
-                        r"@param\s+(?:{(?P<type>[^}]*)})?\s*(?P<n>[^\s]+)?\s*(?P<desc>.*)?",
-                        line,
-                    )
+                    param_match = _JSDOC_PARAM_RE.match(line)
                     if param_match:
                         param = {
                             "name": param_match.group("n") or "",
@@ -204,9 +271,7 @@ class JavaScriptExtractor(BaseExtractor):
                         parsed["params"].append(param)
 
                 elif line.startswith("@returns") or line.startswith("@return"):
-                    returns_match = re.match(
-                        r"@returns?\s+(?:{(?P<type>[^}]*)})?\s*(?P<desc>.*)?", line
-                    )
+                    returns_match = _JSDOC_RETURNS_RE.match(line)
                     if returns_match:
                         parsed["returns"] = {
                             "type": returns_match.group("type") or "",
@@ -214,9 +279,7 @@ class JavaScriptExtractor(BaseExtractor):
                         }
 
                 elif line.startswith("@throws") or line.startswith("@throw"):
-                    throws_match = re.match(
-                        r"@throws?\s+(?:{(?P<type>[^}]*)})?\s*(?P<desc>.*)?", line
-                    )
+                    throws_match = _JSDOC_THROWS_RE.match(line)
                     if throws_match:
                         parsed["throws"].append(
                             {
@@ -278,7 +341,7 @@ class JavaScriptExtractor(BaseExtractor):
                 "params": self._parse_parameters(params_str),
                 "body": body[:200]
                 + ("..." if len(body) > 200 else ""),  # Truncate long bodies
-                "lineno": content[:func_start].count("\n") + 1,
+                "lineno": content.count("\n", 0, func_start) + 1,
                 "readable_name": self._make_readable_name(name),
             }
 
@@ -314,7 +377,7 @@ class JavaScriptExtractor(BaseExtractor):
                 "name": name,
                 "params": self._parse_parameters(params_str),
                 "body": body[:200] + ("..." if len(body) > 200 else ""),
-                "lineno": content[:func_start].count("\n") + 1,
+                "lineno": content.count("\n", 0, func_start) + 1,
                 "readable_name": self._make_readable_name(name),
                 "is_arrow_function": True,
             }
@@ -381,7 +444,7 @@ class JavaScriptExtractor(BaseExtractor):
             class_obj = {
                 "type": "class",
                 "name": name,
-                "lineno": content[:class_start].count("\n") + 1,
+                "lineno": content.count("\n", 0, class_start) + 1,
                 "methods": methods,
                 "readable_name": name,
             }
@@ -397,9 +460,9 @@ class JavaScriptExtractor(BaseExtractor):
             # Also add methods as separate items for searching
             for method in methods:
                 method_copy = method.copy()
-                method_copy["lineno"] = class_obj["lineno"] + body[
-                    : body.find(method["name"])
-                ].count("\n")
+                method_copy["lineno"] = class_obj["lineno"] + body.count(
+                    "\n", 0, body.find(method["name"])
+                )
                 classes.append(method_copy)
 
         return classes
@@ -440,7 +503,7 @@ class JavaScriptExtractor(BaseExtractor):
                 "name": name,
                 "props": props,
                 "body": body[:200] + ("..." if len(body) > 200 else ""),
-                "lineno": content[:comp_start].count("\n") + 1,
+                "lineno": content.count("\n", 0, comp_start) + 1,
                 "readable_name": name,
                 "is_react_component": True,
             }
@@ -469,10 +532,9 @@ class JavaScriptExtractor(BaseExtractor):
         Returns:
             List of JSX element names
         """
-        element_pattern = re.compile(r"<([A-Z][a-zA-Z0-9_$]*)(?:\s|/|>)")
         elements = set()
 
-        for match in element_pattern.finditer(content):
+        for match in _JSX_ELEMENT_RE.finditer(content):
             element_name = match.group(1)
             if element_name and not element_name.startswith(("//", "/*")):
                 elements.add(element_name)
@@ -499,9 +561,7 @@ class JavaScriptExtractor(BaseExtractor):
 
         params = []
         # Handle destructuring and complex patterns
-        param_pattern = re.compile(r"(?:{[^}]*}|\[[^\]]*]|[^,]+)(?:,|$)")
-
-        for param_match in param_pattern.finditer(params_str):
+        for param_match in _PARAM_RE.finditer(params_str):
             param_text = param_match.group(0).strip().rstrip(",")
 
             # Skip empty params
@@ -562,7 +622,7 @@ class JavaScriptExtractor(BaseExtractor):
             Human-readable name
         """
         # Handle camelCase
-        name = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", name)
+        name = _CAMEL_CASE_RE.sub(r"\1 \2", name)
 
         # Handle snake_case
         name = name.replace("_", " ")
@@ -2,16 +2,68 @@
 
 import os
 import re
-from typing import Dict, List, Any
+from collections import OrderedDict
+from typing import Dict, List, Any, Tuple
 
 
 class MarkdownExtractor:
     """Class for extracting information from Markdown files."""
 
+    # Maximum number of files whose extraction results are kept in memory
+    CACHE_SIZE = 128
+
+    # Patterns shared by all instances, compiled once when the class is defined
+    TITLE_RE = re.compile(r"^# (.+)$", re.MULTILINE)
+    SUMMARY_RE = re.compile(r"^(.*?[.!?])\s")
+    HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+    FENCE_RE = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
+
+    def __init__(self):
+        """Initialize the Markdown extractor."""
+        # Extraction results keyed by (path, mtime, size), least recent first
+        self._cache: "OrderedDict[Tuple[str, int, int], List[Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+
     def extract_from_file(self, file_path: str) -> List[Dict[str, Any]]:
         """
         Extract sections and content from a Markdown file.
 
+        Results are cached per file path, modification time and size, so an
+        unchanged file is only parsed once.
+
+        Args:
+            file_path: Path to the Markdown file
+
+        Returns:
+            List of dictionaries containing extracted information
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError as e:
+            print(f"Error extracting from {file_path}: {str(e)}")
+            return []
+
+        key = (file_path, stat.st_mtime_ns, stat.st_size)
+        sections = self._cache.get(key)
+        if sections is None:
+            sections = self._extract_uncached(file_path)
+            if not sections:
+                return sections
+            self._cache[key] = sections
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+
+        # Sections only hold strings and ints, so shallow copies are enough to
+        # let callers modify them without touching the cache
+        return [dict(section) for section in sections]
+
+    def _extract_uncached(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        Extract sections and content from a Markdown file without caching.
+
         Args:
             file_path: Path to the Markdown file
 
@@ -21,9 +73,28 @@ class MarkdownExtractor:
         try:
             with open(file_path, "r", encoding="utf-8") as file:
                 content = file.read()
+        except Exception as e:
+            print(f"Error extracting from {file_path}: {str(e)}")
+            return []
+
+        return self.extract_from_content(content, file_path)
+
+    def extract_from_content(
+        self, content: str, file_path: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract sections and content from Markdown text.
 
+        Args:
+            content: Markdown content
+            file_path: Path the content was read from, used for metadata
+
+        Returns:
+            List of dictionaries containing extracted information
+        """
+        try:
             # Extract the title (first h1)
-            title_match = re.search(r"^# (.+)$", content, re.MULTILINE)
+            title_match = self.TITLE_RE.search(content)
             title = title_match.group(1) if title_match else os.path.basename(file_path)
 
             # Extract sections based on headers
@@ -59,7 +130,7 @@ class MarkdownExtractor:
                 section_content = section.get("content", "")
                 if section_content:
                     # Create a summary by taking the first sentence or first 100 chars
-                    first_sentence = re.match(r"^(.*?[.!?])\s", section_content)
+                    first_sentence = self.SUMMARY_RE.match(section_content)
                     if first_sentence:
                         section["summary"] = first_sentence.group(1)
                     else:
@@ -94,7 +165,7 @@ class MarkdownExtractor:
 
         for i, line in enumerate(lines):
             # Check if this is a header line
-            header_match = re.match(r"^(#{1,6})\s+(.+)$", line)
+            header_match = self.HEADING_RE.match(line)
             if header_match:
                 # If we were building a section, add it to the list
                 if current_section:
@@ -156,9 +227,7 @@ class MarkdownExtractor:
             List of code block dictionaries
         """
         code_blocks = []
-        code_block_pattern = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
-
-        for i, match in enumerate(code_block_pattern.finditer(content)):
+        for i, match in enumerate(self.FENCE_RE.finditer(content)):
             language = match.group(1) or "text"
             code = match.group(2).strip()
             position = match.start()
@@ -169,8 +238,8 @@ class MarkdownExtractor:
                 lines_before = content[:position].split("\n")
                 header_match = None
                 for line in reversed(lines_before[-5:]):  # Look at the 5 lines before
-                    if re.match(r"^(#{1,6})\s+(.+)$", line):
-                        header_match = re.match(r"^(#{1,6})\s+(.+)$", line)
+                    header_match = self.HEADING_RE.match(line)
+                    if header_match:
                         break
 
                 title = (
@@ -1,7 +1,9 @@
 """Module for extracting information from Python files."""
 
 import ast
+import functools
 import os
+import re
 import logging
 from typing import Dict, List, Any, Optional, Iterator, Tuple, Set
 from pathlib import Path
@@ -12,6 +14,16 @@ from src.extractors.base_extractor import BaseExtractor
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Patterns for the line-based chunk reader and the regex fallback extractor
+_DEF_START_RE = re.compile(r"^def\s+\w+\s*\(")
+_CLASS_START_RE = re.compile(r"^class\s+\w+\s*(\(|:)")
+_FUNCTION_RE = re.compile(
+    r'def\s+(\w+)\s*\([^)]*\)[^:]*:(?:\s*"""(.*?)""")?', re.DOTALL
+)
+_CLASS_RE = re.compile(
+    r'class\s+(\w+)(?:\([^)]*\))?[^:]*:(?:\s*"""(.*?)""")?', re.DOTALL
+)
+
 
 class PythonExtractor(BaseExtractor):
     """Class for extracting information from Python files."""
@@ -325,12 +337,6 @@ class PythonExtractor(BaseExtractor):
         Yields:
             Tuples of (function_content, line_number)
         """
-        import re
-
-        # Patterns to detect function and class definitions
-        func_pattern = re.compile(r"^def\s+\w+\s*\(")
-        class_pattern = re.compile(r"^class\s+\w+\s*(\(|:)")
-
         # Read the file line by line
         with open(file_path, "r", encoding="utf-8", errors="replace") as file:
             line_num = 0
@@ -344,7 +350,7 @@ class PythonExtractor(BaseExtractor):
 
                 # Detect the start of a new definition
                 if not in_definition:
-                    if func_pattern.match(line.lstrip()) or class_pattern.match(
+                    if _DEF_START_RE.match(line.lstrip()) or _CLASS_START_RE.match(
                         line.lstrip()
                     ):
                         buffer = [line]
@@ -373,7 +379,7 @@ class PythonExtractor(BaseExtractor):
                     yield content, buffer_start
 
                     # Check if the current line is a new definition
-                    if func_pattern.match(line.lstrip()) or class_pattern.match(
+                    if _DEF_START_RE.match(line.lstrip()) or _CLASS_START_RE.match(
                         line.lstrip()
                     ):
                         buffer = [line]
@@ -401,20 +407,10 @@ class PythonExtractor(BaseExtractor):
         Returns:
             List of extracted items with basic information
         """
-        import re
-
         extracted_items = []
 
-        # Regex patterns for functions, classes and docstrings
-        func_pattern = re.compile(
-            r'def\s+(\w+)\s*\([^)]*\)[^:]*:(?:\s*"""(.*?)""")?', re.DOTALL
-        )
-        class_pattern = re.compile(
-            r'class\s+(\w+)(?:\([^)]*\))?[^:]*:(?:\s*"""(.*?)""")?', re.DOTALL
-        )
-
         # Find all functions
-        for match in func_pattern.finditer(content):
+        for match in _FUNCTION_RE.finditer(content):
             func_name = match.group(1)
             docstring = match.group(2) or ""
 
@@ -435,7 +431,7 @@ class PythonExtractor(BaseExtractor):
             extracted_items.append(func_info)
 
         # Find all classes
-        for match in class_pattern.finditer(content):
+        for match in _CLASS_RE.finditer(content):
             class_name = match.group(1)
             docstring = match.group(2) or ""
 
@@ -471,10 +467,7 @@ class PythonExtractor(BaseExtractor):
             )
 
             # Find methods in this class
-            method_pattern = re.compile(
-                r'def\s+(\w+)\s*\([^)]*\)[^:]*:(?:\s*"""(.*?)""")?', re.DOTALL
-            )
-            for m_match in method_pattern.finditer(class_content_str):
+            for m_match in _FUNCTION_RE.finditer(class_content_str):
                 method_name = m_match.group(1)
                 method_docstring = m_match.group(2) or ""
 
@@ -568,7 +561,9 @@ class PythonExtractor(BaseExtractor):
 
         return f"{value}[...]"
 
-    def _function_name_to_phrase(self, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _function_name_to_phrase(name: str) -> str:
         """Convert function name to a readable phrase."""
         # Handle special cases
         if name.startswith("__") and name.endswith("__"):
@@ -9,6 +9,13 @@ from typing import Dict, List, Any, Optional
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Pattern matches: .. code-block:: python
+_CODE_BLOCK_RE = re.compile(
+    r".. code-block:: (\w+)\s*\n\s*\n(.*?)(?:\n\s*\n|$)", re.DOTALL
+)
+# Indented literal blocks following "::"
+_LITERAL_BLOCK_RE = re.compile(r"::\s*\n\s*\n((?:\s+.*\n)+)", re.MULTILINE)
+
 
 class RSTExtractor:
     """Class for extracting information from reStructuredText files."""
@@ -221,12 +228,7 @@ class RSTExtractor:
         code_blocks = []
 
         # Find all code-block directives
-        # Pattern matches: .. code-block:: python
-        code_pattern = re.compile(
-            r".. code-block:: (\w+)\s*\n\s*\n(.*?)(?:\n\s*\n|$)", re.DOTALL
-        )
-
-        for match in code_pattern.finditer(content):
+        for match in _CODE_BLOCK_RE.finditer(content):
             language = match.group(1) or "text"
             code = match.group(2)
 
@@ -249,9 +251,7 @@ class RSTExtractor:
             )
 
         # Also find literal blocks (indented blocks after ::)
-        literal_pattern = re.compile(r"::\s*\n\s*\n((?:\s+.*\n)+)", re.MULTILINE)
-
-        for match in literal_pattern.finditer(content):
+        for match in _LITERAL_BLOCK_RE.finditer(content):
             code = match.group(1)
 
             # Remove common indentation
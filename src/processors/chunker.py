@@ -1,7 +1,17 @@
 """Module for chunking extracted content into smaller, searchable pieces."""
 
+import re
 from typing import List, Dict, Any
 
+try:
+    from nupunkt import sent_tokenize  # type: ignore
+except ImportError:
+    # nupunkt is optional; the regex splitter below is used without it
+    sent_tokenize = None
+
+# Sentence boundary: end-of-sentence mark, whitespace, then an uppercase letter
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
+
 
 class Chunker:
     """Class for chunking extracted content into smaller, searchable pieces."""
@@ -28,24 +38,12 @@ class Chunker:
         chunked_items = []
 
         for item in items:
-            # Different chunking strategies based on item type
-            item_type = item.get("type", "")
-
-            if item_type in ("function", "method", "class"):
-                # Functions, methods, and classes are already natural chunks
-                chunked_items.append(item)
-
-            elif item_type == "section":
+            if item.get("type") == "section":
                 # Sections may need to be split into smaller chunks
-                section_chunks = self._chunk_section(item)
-                chunked_items.extend(section_chunks)
-
-            elif item_type == "module":
-                # Module docstrings can be large, so chunk them
-                chunked_items.append(item)
-
+                chunked_items.extend(self._chunk_section(item))
             else:
-                # Default: just add the item as is
+                # Functions, methods, classes and modules are already natural
+                # chunks; other items are passed through as is
                 chunked_items.append(item)
 
         return chunked_items
@@ -66,40 +64,34 @@ class Chunker:
         if len(content) <= self.max_chunk_size:
             return [section]
 
-        # Otherwise, split the content into paragraphs and chunk them
-        chunks = []
-        paragraphs = self._split_into_paragraphs(content)
-
-        current_chunk = ""
-        current_chunk_data = section.copy()
-        chunk_index = 0
+        # Otherwise, split the content into paragraphs and group them into
+        # chunks, tracking each group's joined length instead of building the
+        # string paragraph by paragraph
+        groups: List[List[str]] = []
+        current_chunk: List[str] = []
+        current_length = 0
 
-        for para in paragraphs:
+        for para in self._split_into_paragraphs(content):
             # If adding this paragraph would exceed the max size, create a new chunk
-            if len(current_chunk) + len(para) > self.max_chunk_size and current_chunk:
-                # Save the current chunk
-                current_chunk_data["content"] = current_chunk
-                current_chunk_data["chunk_index"] = chunk_index
-                chunks.append(current_chunk_data)
-
-                # Start a new chunk
-                current_chunk_data = section.copy()
-                current_chunk = para
-                chunk_index += 1
+            if current_length + len(para) > self.max_chunk_size and current_length:
+                groups.append(current_chunk)
+                current_chunk = [para]
+                current_length = len(para)
             else:
                 # Add to the current chunk
                 if current_chunk:
-                    current_chunk += "\n\n" + para
-                else:
-                    current_chunk = para
+                    current_length += 2  # "\n\n" separator
+                current_chunk.append(para)
+                current_length += len(para)
 
         # Save the last chunk if there's anything left
         if current_chunk:
-            current_chunk_data["content"] = current_chunk
-            current_chunk_data["chunk_index"] = chunk_index
-            chunks.append(current_chunk_data)
+            groups.append(current_chunk)
 
-        return chunks
+        return [
+            {**section, "content": "\n\n".join(group), "chunk_index": chunk_index}
+            for chunk_index, group in enumerate(groups)
+        ]
 
     def _split_into_paragraphs(self, text: str) -> List[str]:
         """
@@ -111,8 +103,9 @@ class Chunker:
         Returns:
             List of paragraphs
         """
-        # Split by double newline (paragraph boundary)
-        paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
+        # Split by double newline (paragraph boundary); str.split scans the
+        # text in C, so each paragraph is only stripped once afterwards
+        paragraphs = [p for p in (part.strip() for part in text.split("\n\n")) if p]
 
         # If paragraphs are still too large, split them further
         result = []
@@ -120,25 +113,27 @@ class Chunker:
             if len(para) <= self.max_chunk_size:
                 result.append(para)
             else:
-                # Split long paragraph into sentences
-                sentences = self._split_into_sentences(para)
-                current_chunk = ""
+                # Split long paragraph into sentences, joining each chunk once
+                # instead of growing a string sentence by sentence
+                current_chunk: List[str] = []
+                current_length = 0
 
-                for sentence in sentences:
+                for sentence in self._split_into_sentences(para):
                     if (
-                        len(current_chunk) + len(sentence) > self.max_chunk_size
-                        and current_chunk
+                        current_length + len(sentence) > self.max_chunk_size
+                        and current_length
                     ):
-                        result.append(current_chunk)
-                        current_chunk = sentence
+                        result.append(" ".join(current_chunk))
+                        current_chunk = [sentence]
+                        current_length = len(sentence)
                     else:
                         if current_chunk:
-                            current_chunk += " " + sentence
-                        else:
-                            current_chunk = sentence
+                            current_length += 1
+                        current_chunk.append(sentence)
+                        current_length += len(sentence)
 
-                if current_chunk:
-                    result.append(current_chunk)
+                if current_length:
+                    result.append(" ".join(current_chunk))
 
         return result
 
@@ -152,10 +147,10 @@ class Chunker:
         Returns:
             List of sentences
         """
+        # nupunkt handles abbreviations and runs at millions of chars per second
+        if sent_tokenize is not None:
+            return sent_tokenize(text)
+
         # Simple sentence splitting - not perfect but good enough for chunking
         # Handles common end-of-sentence marks followed by a space and uppercase letter
-        import re
-
-        sentence_endings = r"(?<=[.!?])\s+(?=[A-Z])"
-        sentences = re.split(sentence_endings, text)
-        return sentences
+        return _SENTENCE_END_RE.split(text)
@@ -3,9 +3,10 @@
 import re
 import string
 import logging
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 import spacy
 from spacy.language import Language
+from spacy.tokens import Doc
 import nltk  # type: ignore
 from nltk.stem import WordNetLemmatizer  # type: ignore
 
@@ -13,10 +14,27 @@ from nltk.stem import WordNetLemmatizer  # type: ignore
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Patterns used by clean_text and _remove_code_blocks, compiled once at import
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_CODE_BLOCK_RE = re.compile(r"```.*?```", re.DOTALL)
+
+# Maps every ASCII character _PUNCT_RE would replace to a space, so ASCII text
+# can be cleaned with a single str.translate pass
+_ASCII_PUNCT_TABLE = str.maketrans(
+    {
+        c: " "
+        for c in map(chr, range(128))
+        if not (c.isalnum() or c == "_" or c.isspace())
+    }
+)
+
 
 class TextProcessor:
     """Class for processing and preparing text for indexing and search."""
 
+    # Number of texts spaCy processes per batch in clean_texts
+    SPACY_BATCH_SIZE = 256
+
     def __init__(self, stop_words: Optional[List[str]] = None, use_spacy: bool = True):
         """
         Initialize the text processor.
@@ -61,37 +79,76 @@ class TextProcessor:
         Returns:
             Dictionary with processed text
         """
+        processed_chunk, text = self._prepare_chunk(chunk)
+        if text is not None:
+            processed_chunk["processed_text"] = self.clean_text(text)
+        return processed_chunk
+
+    def process_chunks(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process a batch of chunks to prepare them for indexing.
+
+        Equivalent to calling process_chunk on every chunk, but the texts are
+        cleaned together with clean_texts.
+
+        Args:
+            chunks: List of dictionaries containing the chunk data
+
+        Returns:
+            List of dictionaries with processed text, in the order of chunks
+        """
+        prepared = [self._prepare_chunk(chunk) for chunk in chunks]
+        texts = [text for _, text in prepared if text is not None]
+        cleaned = iter(self.clean_texts(texts))
+
+        processed_chunks = []
+        for processed_chunk, text in prepared:
+            if text is not None:
+                processed_chunk["processed_text"] = next(cleaned)
+            processed_chunks.append(processed_chunk)
+        return processed_chunks
+
+    def _prepare_chunk(
+        self, chunk: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Copy a chunk and add its metadata fields, without cleaning any text.
+
+        Args:
+            chunk: Dictionary containing the chunk data
+
+        Returns:
+            Tuple of the processed chunk and the text to clean into its
+            "processed_text", or None if the chunk type has no such text
+        """
         processed_chunk = chunk.copy()
+        text: Optional[str] = None
 
         # Process different chunk types
         chunk_type = chunk.get("type", "")
 
         if chunk_type == "function":
             # Process function chunks
-            docstring = chunk.get("docstring", "")
-            processed_chunk["processed_text"] = self.clean_text(docstring)
+            text = chunk.get("docstring", "")
             processed_chunk["function_signature"] = self._get_function_signature(chunk)
             processed_chunk["content_type"] = "code"
 
         elif chunk_type == "method":
             # Process method chunks
-            docstring = chunk.get("docstring", "")
-            processed_chunk["processed_text"] = self.clean_text(docstring)
+            text = chunk.get("docstring", "")
             processed_chunk["method_signature"] = self._get_function_signature(chunk)
             processed_chunk["content_type"] = "code"
 
         elif chunk_type == "class":
             # Process class chunks
-            docstring = chunk.get("docstring", "")
-            processed_chunk["processed_text"] = self.clean_text(docstring)
+            text = chunk.get("docstring", "")
             processed_chunk["content_type"] = "code"
 
         elif chunk_type == "section":
             # Process markdown section chunks
             content = chunk.get("content", "")
             # Remove code blocks for text analysis (but keep them in the raw content)
-            cleaned_content = self._remove_code_blocks(content)
-            processed_chunk["processed_text"] = self.clean_text(cleaned_content)
+            text = self._remove_code_blocks(content)
             processed_chunk["content_type"] = "documentation"
             # Add section type classification if possible
             section_title = chunk.get("title", "").lower()
@@ -106,7 +163,7 @@ class TextProcessor:
             else:
                 processed_chunk["section_type"] = "general"
 
-        return processed_chunk
+        return processed_chunk, text
 
     def clean_text(self, text: str) -> str:
         """
@@ -121,12 +178,7 @@ class TextProcessor:
         if not text:
             return ""
 
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove special characters and extra whitespace
-        text = re.sub(r"[^\w\s]", " ", text)
-        text = re.sub(r"\s+", " ", text).strip()
+        text = self._normalize(text)
 
         # Process with available NLP tool
         if self.use_spacy and self.nlp is not None:
@@ -139,6 +191,48 @@ class TextProcessor:
             words = [word for word in words if word not in self.stop_words]
             return " ".join(words)
 
+    def clean_texts(self, texts: List[str]) -> List[str]:
+        """
+        Clean and normalize a batch of texts.
+
+        Gives the same results as calling clean_text on every text, but with
+        spaCy the texts are run through the pipeline in batches.
+
+        Args:
+            texts: Texts to clean
+
+        Returns:
+            Cleaned texts, in the order of texts
+        """
+        if not (self.use_spacy and self.nlp is not None):
+            return [self.clean_text(text) for text in texts]
+
+        normalized = [self._normalize(text) if text else "" for text in texts]
+        docs = self.nlp.pipe(
+            (text for text in normalized if text), batch_size=self.SPACY_BATCH_SIZE
+        )
+        return [
+            self._spacy_doc_to_text(next(docs)) if text else "" for text in normalized
+        ]
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """
+        Lowercase text, replace punctuation with spaces and collapse whitespace.
+
+        Args:
+            text: Non-empty text to normalize
+
+        Returns:
+            Normalized text
+        """
+        text = text.lower()
+        if text.isascii():
+            text = text.translate(_ASCII_PUNCT_TABLE)
+        else:
+            text = _PUNCT_RE.sub(" ", text)
+        return " ".join(text.split())
+
     def _process_with_spacy(self, text: str) -> str:
         """
         Process text using spaCy for lemmatization and stop word removal.
@@ -152,7 +246,19 @@ class TextProcessor:
         if self.nlp is None:
             return text
 
-        doc = self.nlp(text)
+        return self._spacy_doc_to_text(self.nlp(text))
+
+    @staticmethod
+    def _spacy_doc_to_text(doc: Doc) -> str:
+        """
+        Join the lemmas of a spaCy doc, dropping stop words and punctuation.
+
+        Args:
+            doc: Processed spaCy doc
+
+        Returns:
+            Processed text
+        """
         tokens = [
             token.lemma_
             for token in doc
@@ -193,18 +299,15 @@ class TextProcessor:
         """
         name = func_data.get("full_name", func_data.get("name", ""))
 
-        # Build parameters string
-        params = []
-        for param in func_data.get("parameters", []):
-            param_name = param.get("name", "")
-            param_type = param.get("type", "")
-
-            if param_type:
-                params.append(f"{param_name}: {param_type}")
-            else:
-                params.append(param_name)
-
-        param_str = ", ".join(params)
+        # Build parameters string in one join
+        param_str = ", ".join(
+            (
+                f"{param.get('name', '')}: {param['type']}"
+                if param.get("type")
+                else param.get("name", "")
+            )
+            for param in func_data.get("parameters", [])
+        )
 
         # Add return type if available
         returns = func_data.get("returns", "")
@@ -223,15 +326,12 @@ class TextProcessor:
             Text with code blocks removed
         """
         # Remove fenced code blocks: ```language\ncode\n```
-        text = re.sub(r"```.*?```", "", text, flags=re.DOTALL)
+        text = _CODE_BLOCK_RE.sub("", text)
 
         # Remove indented code blocks (lines starting with 4 spaces or a tab)
-        lines = []
-        for line in text.split("\n"):
-            if not line.startswith("    ") and not line.startswith("\t"):
-                lines.append(line)
-
-        return "\n".join(lines)
+        return "\n".join(
+            line for line in text.split("\n") if not line.startswith(("    ", "\t"))
+        )
 
     def _get_default_stop_words(self) -> List[str]:
         """
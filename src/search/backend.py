@@ -0,0 +1,112 @@
+"""Interface shared by all search backends."""
+
+from typing import List, Dict, Any, Optional, Protocol, runtime_checkable
+import numpy as np
+
+
+@runtime_checkable
+class SearchBackend(Protocol):
+    """Structural interface that every search backend must implement."""
+
+    def add_chunks(self, chunks: List[Dict[str, Any]]) -> None:
+        """
+        Add processed chunks to the search index.
+
+        Args:
+            chunks: List of processed document chunks
+        """
+        ...
+
+    def merge_from(self, other: "SearchBackend") -> None:
+        """
+        Append the chunks and vectors of another backend to this one.
+
+        Args:
+            other: Backend of the same kind, built with the same model
+        """
+        ...
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        content_filter: Optional[str] = None,
+        min_score: float = 0.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for chunks relevant to the query.
+
+        Args:
+            query: Search query
+            top_k: Number of results to return
+            content_filter: Filter by content type ('code' or 'documentation')
+            min_score: Minimum similarity score threshold
+
+        Returns:
+            List of search results with similarity scores and chunk ids
+        """
+        ...
+
+    def search_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        content_filter: Optional[str] = None,
+        min_score: float = 0.0,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for chunks relevant to several queries at once.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results to return per query
+            content_filter: Filter by content type ('code' or 'documentation')
+            min_score: Minimum similarity score threshold
+
+        Returns:
+            One list of search results per query, as returned by search
+        """
+        ...
+
+    def match_chunks(
+        self,
+        ids: np.ndarray,
+        type_filter: Optional[str] = None,
+        param_type: Optional[str] = None,
+        param_name: Optional[str] = None,
+        return_type: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Evaluate type and signature filters over indexed chunks.
+
+        Signature needles must already be lowercased. Passing any signature
+        needle restricts matches to function and method chunks.
+
+        Args:
+            ids: "chunk_id" values of search results
+            type_filter: Required chunk type
+            param_type: Substring required in some parameter type
+            param_name: Substring required in some parameter name
+            return_type: Substring required in the return type
+
+        Returns:
+            Boolean mask aligned with ids
+        """
+        ...
+
+    def build_index(self) -> None:
+        """Build the search index from added chunks."""
+        ...
+
+    def reset(self) -> None:
+        """Drop all indexed chunks and delete the saved index."""
+        ...
+
+    def load_index(self) -> bool:
+        """
+        Load a pre-built search index.
+
+        Returns:
+            True if index was loaded successfully, False otherwise
+        """
+        ...
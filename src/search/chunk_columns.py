@@ -0,0 +1,349 @@
+"""Columnar (struct-of-arrays) storage for chunk fields used in filtering."""
+
+from typing import List, Dict, Any, Optional, BinaryIO
+import numpy as np
+
+
+class EncodedColumn:
+    """
+    Dictionary-encoded string column.
+
+    Each row holds an integer code into a vocabulary of the distinct values,
+    so long values are stored once rather than widening every row, and
+    filters only need to be evaluated once per distinct value. Appended rows
+    are buffered in a list and only turned into an array when codes are read.
+    """
+
+    def __init__(self):
+        """Initialize an empty column."""
+        self.values: List[str] = []
+        self._codes_by_value: Dict[str, int] = {}
+        self._codes: np.ndarray = np.empty(0, dtype=np.int32)
+        self._pending: List[int] = []
+        self._vocabulary: np.ndarray = np.empty(0, dtype=np.str_)
+
+    @property
+    def codes(self) -> np.ndarray:
+        """Return the code of every row, materializing buffered appends."""
+        if self._pending:
+            self._codes = np.concatenate(
+                [self._codes, np.array(self._pending, dtype=np.int32)]
+            )
+            self._pending = []
+        return self._codes
+
+    def __len__(self) -> int:
+        """Return the number of rows in the column."""
+        return len(self._codes) + len(self._pending)
+
+    def append(self, value: str) -> None:
+        """
+        Append a row.
+
+        Args:
+            value: Value of the new row
+        """
+        self._pending.append(self._encode(value))
+
+    def extend_column(self, other: "EncodedColumn") -> None:
+        """
+        Append the rows of another column, translating its codes.
+
+        Args:
+            other: Column whose rows to append
+        """
+        if len(other) == 0:
+            return
+        mapping = np.array([self._encode(v) for v in other.values], dtype=np.int32)
+        self._codes = np.concatenate([self.codes, mapping[other.codes]])
+
+    def code_of(self, value: str) -> int:
+        """Return the code of a value, or -1 if no row holds it."""
+        return self._codes_by_value.get(value, -1)
+
+    def decode(self) -> List[str]:
+        """Return the value of every row."""
+        return [self.values[code] for code in self.codes]
+
+    def contains(self, needle: str) -> np.ndarray:
+        """
+        Check which vocabulary entries are non-empty and contain a substring.
+
+        Args:
+            needle: Substring to look for
+
+        Returns:
+            Boolean mask over the vocabulary, to be indexed by row codes
+        """
+        if len(self._vocabulary) != len(self.values):
+            self._vocabulary = np.array(self.values, dtype=np.str_)
+        if len(self._vocabulary) == 0:
+            return np.zeros(0, dtype=bool)
+        return (np.char.find(self._vocabulary, needle) >= 0) & (
+            self._vocabulary != ""
+        )
+
+    def save(self, f: BinaryIO) -> None:
+        """Write the vocabulary and codes as consecutive .npy arrays."""
+        np.save(f, np.array(self.values, dtype=np.str_), allow_pickle=False)
+        np.save(f, self.codes, allow_pickle=False)
+
+    @classmethod
+    def load(cls, f: BinaryIO) -> "EncodedColumn":
+        """Read a column written by EncodedColumn.save."""
+        column = cls()
+        column.values = [str(v) for v in np.load(f, allow_pickle=False)]
+        column._codes_by_value = {v: i for i, v in enumerate(column.values)}
+        column._codes = np.load(f, allow_pickle=False)
+        return column
+
+    def _encode(self, value: str) -> int:
+        """Return the code of a value, adding it to the vocabulary if needed."""
+        code = self._codes_by_value.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._codes_by_value[value] = code
+        return code
+
+
+class ChunkColumns:
+    """
+    Struct-of-arrays view over the filterable fields of indexed chunks.
+
+    Each chunk is addressed by its position in the backend's chunk list.
+    String fields are dictionary-encoded (see EncodedColumn). Parameters are
+    stored in a CSR-style jagged layout: the parameters of chunk ``i`` live
+    at ``param_offsets[i]:param_offsets[i + 1]``.
+    """
+
+    # Bumped whenever the saved layout changes
+    FORMAT_VERSION = 2
+
+    _ENCODED_FIELDS = (
+        "types",
+        "content_types",
+        "return_types_lower",
+        "param_names_lower",
+        "param_types_lower",
+    )
+
+    def __init__(self):
+        """Initialize empty columns."""
+        self.types: EncodedColumn = EncodedColumn()
+        self.content_types: EncodedColumn = EncodedColumn()
+        self.return_types_lower: EncodedColumn = EncodedColumn()
+        self.param_names_lower: EncodedColumn = EncodedColumn()
+        self.param_types_lower: EncodedColumn = EncodedColumn()
+        self._param_offsets: np.ndarray = np.zeros(1, dtype=np.int64)
+        self._pending_param_counts: List[int] = []
+
+    @classmethod
+    def from_chunks(cls, chunks: List[Dict[str, Any]]) -> "ChunkColumns":
+        """
+        Build columns for a list of chunks.
+
+        Args:
+            chunks: List of processed chunks
+
+        Returns:
+            Columns holding the filterable fields of the chunks
+        """
+        columns = cls()
+        columns.extend(chunks)
+        return columns
+
+    @classmethod
+    def load(cls, file_path: str) -> "ChunkColumns":
+        """
+        Load columns saved with ChunkColumns.save.
+
+        Args:
+            file_path: Path to the saved columns
+
+        Returns:
+            The loaded columns
+
+        Raises:
+            ValueError: If the file was written in another layout
+        """
+        columns = cls()
+        with open(file_path, "rb") as f:
+            version = np.load(f, allow_pickle=False)
+            if version.shape != (1,) or version[0] != cls.FORMAT_VERSION:
+                raise ValueError(f"Unsupported chunk columns layout in {file_path}")
+            for name in cls._ENCODED_FIELDS:
+                setattr(columns, name, EncodedColumn.load(f))
+            columns._param_offsets = np.load(f, allow_pickle=False)
+        return columns
+
+    def save(self, file_path: str) -> None:
+        """
+        Save the columns as consecutive .npy arrays in a single file.
+
+        Args:
+            file_path: Destination path
+        """
+        with open(file_path, "wb") as f:
+            np.save(f, np.array([self.FORMAT_VERSION], dtype=np.int64))
+            for name in self._ENCODED_FIELDS:
+                getattr(self, name).save(f)
+            np.save(f, self.param_offsets, allow_pickle=False)
+
+    @property
+    def param_offsets(self) -> np.ndarray:
+        """Return the parameter offsets, materializing buffered appends."""
+        if self._pending_param_counts:
+            offsets = self._param_offsets[-1] + np.cumsum(
+                self._pending_param_counts, dtype=np.int64
+            )
+            self._param_offsets = np.concatenate([self._param_offsets, offsets])
+            self._pending_param_counts = []
+        return self._param_offsets
+
+    def __len__(self) -> int:
+        """Return the number of chunks stored in the columns."""
+        return len(self.types)
+
+    def extend(self, chunks: List[Dict[str, Any]]) -> None:
+        """
+        Append the filterable fields of chunks to the columns.
+
+        Rows are buffered and only materialized into arrays when the columns
+        are next read, so repeated small appends stay linear overall.
+
+        Args:
+            chunks: List of processed chunks to append
+        """
+        for chunk in chunks:
+            self.types.append(chunk.get("type") or "")
+            self.content_types.append(chunk.get("content_type") or "")
+
+            return_type = chunk.get("return_type", chunk.get("returns", ""))
+            self.return_types_lower.append(
+                str(return_type).lower() if return_type else ""
+            )
+
+            # Get parameters list from either "parameters" or "params" field
+            parameters = chunk.get("parameters", chunk.get("params", [])) or []
+            self._pending_param_counts.append(len(parameters))
+            for param in parameters:
+                self.param_names_lower.append(str(param.get("name") or "").lower())
+                self.param_types_lower.append(str(param.get("type") or "").lower())
+
+    def extend_columns(self, other: "ChunkColumns") -> None:
+        """
+        Append the columns of other, without re-reading any chunk dicts.
+
+        Args:
+            other: Columns of the chunks to append
+        """
+        if len(other) == 0:
+            return
+
+        # Shift the other parameter offsets past the parameters already stored
+        offsets = self.param_offsets[-1] + other.param_offsets[1:]
+        self._param_offsets = np.concatenate([self._param_offsets, offsets])
+        for name in self._ENCODED_FIELDS:
+            getattr(self, name).extend_column(getattr(other, name))
+
+    def mask_equal(self, name: str, value: str) -> np.ndarray:
+        """
+        Return a mask of the chunks whose encoded field equals a value.
+
+        Args:
+            name: Name of an encoded field, e.g. "content_types"
+            value: Value to compare with
+
+        Returns:
+            Boolean mask over all chunks
+        """
+        column: EncodedColumn = getattr(self, name)
+        return column.codes == column.code_of(value)
+
+    def match(
+        self,
+        ids: np.ndarray,
+        type_filter: Optional[str] = None,
+        param_type: Optional[str] = None,
+        param_name: Optional[str] = None,
+        return_type: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Evaluate filters over a set of chunks.
+
+        Signature needles must already be lowercased. Passing any signature
+        needle restricts matches to function and method chunks.
+
+        Args:
+            ids: Positions of the candidate chunks
+            type_filter: Required chunk type
+            param_type: Substring required in some parameter type
+            param_name: Substring required in some parameter name
+            return_type: Substring required in the return type
+
+        Returns:
+            Boolean mask aligned with ids
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        mask = np.ones(len(ids), dtype=bool)
+        type_codes = self.types.codes[ids]
+
+        if type_filter is not None:
+            mask &= type_codes == self.types.code_of(type_filter)
+
+        if param_type is None and param_name is None and return_type is None:
+            return mask
+
+        # For non-function chunks, no signature to match
+        mask &= np.isin(
+            type_codes, (self.types.code_of("function"), self.types.code_of("method"))
+        )
+
+        # Checks run cheapest first: one string per chunk for the return type,
+        # then the parameter scans, which only visit surviving candidates
+        if return_type is not None:
+            column = self.return_types_lower
+            mask &= column.contains(return_type)[column.codes[ids]]
+
+        for column, needle in (
+            (self.param_names_lower, param_name),
+            (self.param_types_lower, param_type),
+        ):
+            if needle is None:
+                continue
+            survivors = np.flatnonzero(mask)
+            if len(survivors) == 0:
+                break
+            mask[survivors] = self._any_param_contains(ids[survivors], column, needle)
+
+        return mask
+
+    def _any_param_contains(
+        self, ids: np.ndarray, column: EncodedColumn, needle: str
+    ) -> np.ndarray:
+        """
+        Check, per chunk, whether any of its parameters contains a substring.
+
+        Args:
+            ids: Positions of the candidate chunks
+            column: Parameter column to search
+            needle: Lowercased substring to look for
+
+        Returns:
+            Boolean mask aligned with ids
+        """
+        param_offsets = self.param_offsets
+        starts = param_offsets[ids]
+        lengths = param_offsets[ids + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(len(ids), dtype=bool)
+
+        # Gather the parameter rows of every candidate into one flat slice
+        segment = np.repeat(np.arange(len(ids)), lengths)
+        segment_starts = np.cumsum(lengths) - lengths
+        positions = np.arange(total) - segment_starts[segment] + starts[segment]
+
+        hits = column.contains(needle)[column.codes[positions]]
+        return np.bincount(segment[hits], minlength=len(ids)) > 0
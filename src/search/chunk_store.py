@@ -0,0 +1,142 @@
+"""Memory-mapped on-disk storage for chunk payloads."""
+
+import os
+import json
+import mmap
+from typing import List, Dict, Any, Iterator, Sequence, Union
+import numpy as np
+
+
+class MappedChunks(Sequence):
+    """
+    List-like view over chunks stored in a memory-mapped payload file.
+
+    Chunks are stored as concatenated JSON records, with their byte ranges
+    kept in a separate offsets array. A chunk is only decoded when it is
+    accessed, so loading an index does not materialize every chunk dict.
+    Chunks added after loading are kept in memory.
+    """
+
+    def __init__(self, payload_path: str, offsets_path: str):
+        """
+        Open a chunk store written by MappedChunks.write.
+
+        Args:
+            payload_path: Path to the concatenated chunk records
+            offsets_path: Path to the .npy array of record offsets
+        """
+        self._offsets: np.ndarray = np.load(offsets_path, mmap_mode="r")
+        self._appended: List[Dict[str, Any]] = []
+
+        # mmap cannot map an empty file, so an empty store is held as bytes
+        self._payload: Union[mmap.mmap, bytes] = b""
+        if os.path.getsize(payload_path) > 0:
+            with open(payload_path, "rb") as f:
+                self._payload = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def write(
+        chunks: Sequence[Dict[str, Any]], payload_path: str, offsets_path: str
+    ) -> None:
+        """
+        Write chunks to a payload file and an offsets array.
+
+        Existing files are unlinked rather than truncated, so stores that
+        currently map them keep reading the old data.
+
+        Args:
+            chunks: Chunks to write
+            payload_path: Destination of the concatenated chunk records
+            offsets_path: Destination of the .npy array of record offsets
+        """
+        for path in (payload_path, offsets_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+        offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+        with open(payload_path, "wb") as f:
+            for i, chunk in enumerate(chunks):
+                record = json.dumps(chunk).encode("utf-8")
+                f.write(record)
+                offsets[i + 1] = offsets[i] + len(record)
+
+        with open(offsets_path, "wb") as f:
+            np.save(f, offsets)
+
+    def __len__(self) -> int:
+        """Return the number of stored chunks."""
+        return len(self._offsets) - 1 + len(self._appended)
+
+    def __getitem__(self, index):
+        """Decode and return the chunk(s) at the given position(s)."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("chunk index out of range")
+
+        mapped = len(self._offsets) - 1
+        if index >= mapped:
+            return self._appended[index - mapped]
+
+        start, end = int(self._offsets[index]), int(self._offsets[index + 1])
+        return json.loads(self._payload[start:end])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over all chunks, decoding them one at a time."""
+        for i in range(len(self)):
+            yield self[i]
+
+    def extend(self, chunks: List[Dict[str, Any]]) -> None:
+        """
+        Append chunks in memory.
+
+        Args:
+            chunks: Chunks to append
+        """
+        self._appended.extend(chunks)
+
+
+class ChunkSubset(Sequence):
+    """List-like view over a subset of another chunk sequence."""
+
+    def __init__(self, chunks: Sequence[Dict[str, Any]], ids: np.ndarray):
+        """
+        Initialize the view.
+
+        Args:
+            chunks: Underlying chunk sequence
+            ids: Positions in chunks that make up this subset
+        """
+        self._chunks = chunks
+        self._ids = ids
+        self._appended: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        """Return the number of chunks in the subset."""
+        return len(self._ids) + len(self._appended)
+
+    def __getitem__(self, index):
+        """Return the chunk(s) at the given position(s) within the subset."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("chunk index out of range")
+
+        if index >= len(self._ids):
+            return self._appended[index - len(self._ids)]
+        return self._chunks[int(self._ids[index])]
+
+    def extend(self, chunks: List[Dict[str, Any]]) -> None:
+        """
+        Append chunks in memory.
+
+        Args:
+            chunks: Chunks to append
+        """
+        self._appended.extend(chunks)
@@ -0,0 +1,115 @@
+"""Persistent cache of chunk embeddings keyed by content hash."""
+
+import sqlite3
+import hashlib
+from contextlib import closing
+from typing import List, Dict, Optional
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed store of embeddings keyed by model name and text hash.
+
+    Re-indexing a repository only needs to encode texts whose hash is not
+    already in the cache, so unchanged chunks never reach the model. Once the
+    cache holds more than max_entries embeddings, the least recently stored
+    ones are evicted.
+    """
+
+    # Default number of embeddings kept before the oldest are evicted
+    MAX_ENTRIES = 100_000
+
+    def __init__(
+        self, db_path: str, model_name: str, max_entries: Optional[int] = None
+    ):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+            model_name: Name of the model the embeddings were produced with
+            max_entries: Maximum number of embeddings to keep, across all
+                models (defaults to MAX_ENTRIES)
+        """
+        self.db_path: str = db_path
+        self.model_name: str = model_name
+        self.max_entries: int = self.MAX_ENTRIES if max_entries is None else max_entries
+
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, "
+                "hash TEXT NOT NULL, "
+                "vector BLOB NOT NULL, "
+                "PRIMARY KEY (model, hash))"
+            )
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """
+        Compute the cache key of a text.
+
+        Args:
+            text: Text that is embedded
+
+        Returns:
+            Hex digest of the text
+        """
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get_many(self, hashes: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up cached embeddings.
+
+        Args:
+            hashes: Text hashes to look up
+
+        Returns:
+            Dictionary mapping the hashes found in the cache to their embeddings
+        """
+        found: Dict[str, np.ndarray] = {}
+        unique = list(dict.fromkeys(hashes))
+
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            # Stay well below SQLite's limit on bound parameters
+            for start in range(0, len(unique), 500):
+                batch = unique[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    "SELECT hash, vector FROM embeddings "
+                    f"WHERE model = ? AND hash IN ({placeholders})",
+                    [self.model_name, *batch],
+                )
+                for text_hash, vector in rows:
+                    found[text_hash] = np.frombuffer(vector, dtype=np.float32)
+
+        return found
+
+    def put_many(self, hashes: List[str], embeddings: np.ndarray) -> None:
+        """
+        Store embeddings in the cache.
+
+        Args:
+            hashes: Text hashes, aligned with embeddings
+            embeddings: Embeddings to store
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, hash, vector) "
+                "VALUES (?, ?, ?)",
+                (
+                    (self.model_name, text_hash, embedding.tobytes())
+                    for text_hash, embedding in zip(hashes, embeddings)
+                ),
+            )
+
+            # Replaced rows get a new rowid, so the smallest rowids are the
+            # embeddings stored least recently
+            conn.execute(
+                "DELETE FROM embeddings WHERE rowid IN ("
+                "SELECT rowid FROM embeddings ORDER BY rowid "
+                "LIMIT max(0, (SELECT count(*) FROM embeddings) - ?))",
+                (self.max_entries,),
+            )
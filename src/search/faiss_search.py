@@ -3,24 +3,56 @@
 import os
 import json
 import logging
+import functools
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Union, Tuple, cast
 import numpy as np
 import faiss  # type: ignore
 from sentence_transformers import SentenceTransformer
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+from src.search.chunk_columns import ChunkColumns
+from src.search.chunk_store import MappedChunks, ChunkSubset
+from src.search.embedding_cache import EmbeddingCache
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_model(model_name: str) -> SentenceTransformer:
+    """
+    Load a SentenceTransformer model, sharing it between engine instances.
+
+    Inference does not mutate the model, so engines created for the same
+    model name can safely reuse one copy of the weights.
+
+    Args:
+        model_name: Name of the SentenceTransformer model to load
+
+    Returns:
+        The loaded model
+    """
+    return SentenceTransformer(model_name)
+
+
 class FaissSearchEngine:
     """Class for semantic search using FAISS vector similarity."""
 
+    # Texts per forward pass inside a model.encode call
+    MODEL_BATCH_SIZE = 64
+    # HNSW graph degree and candidate list sizes for building and searching
+    HNSW_M = 32
+    HNSW_EF_CONSTRUCTION = 200
+    HNSW_EF_SEARCH = 64
+    # Maximum number of formatted display strings kept for returned chunks
+    DISPLAY_CACHE_SIZE = 1024
+
     def __init__(
         self,
         model_name: str = "all-MiniLM-L6-v2",
         data_dir: str = "data/processed",
         use_gpu: bool = False,
+        quantization: Optional[str] = None,
+        index_type: str = "flat",
     ):
         """
         Initialize the FAISS search engine.
@@ -29,50 +61,83 @@ class FaissSearchEngine:
             model_name: Name of the SentenceTransformer model to use
             data_dir: Directory to store/load processed data and embeddings
             use_gpu: Whether to use GPU acceleration if available
+            quantization: Store vectors as 'fp16' or 'int8' instead of float32
+            index_type: 'flat' for exact search or 'hnsw' for approximate
+                graph-based search
         """
+        if quantization not in (None, "fp16", "int8"):
+            raise ValueError(f"Unsupported quantization: {quantization}")
+        if index_type not in ("flat", "hnsw"):
+            raise ValueError(f"Unsupported index type: {index_type}")
+
         self.model_name: str = model_name
         self.data_dir: str = data_dir
         self.use_gpu: bool = use_gpu
+        self.quantization: Optional[str] = quantization
+        self.index_type: str = index_type
 
         # Load the sentence transformer model
-        self.model: SentenceTransformer = SentenceTransformer(model_name)
+        self.model: SentenceTransformer = _load_model(model_name)
         self.dimension: int = cast(int, self.model.get_sentence_embedding_dimension())
 
         # Initialize index variables
-        self.index: Optional[Union[faiss.IndexFlatIP, faiss.GpuIndexFlatIP]] = None
-        self.chunks: List[Dict[str, Any]] = []
+        self.index: Optional[faiss.Index] = None
+        self.chunks: Union[List[Dict[str, Any]], MappedChunks] = []
         self.index_metadata: Dict[str, Any] = {}
 
-        # Create separate indices for code and documentation
-        self.code_index: Optional[Union[faiss.IndexFlatIP, faiss.GpuIndexFlatIP]] = None
-        self.code_chunks: List[Dict[str, Any]] = []
-        self.doc_index: Optional[Union[faiss.IndexFlatIP, faiss.GpuIndexFlatIP]] = None
-        self.doc_chunks: List[Dict[str, Any]] = []
+        # Code and documentation chunks, in the same relative order as in
+        # self.chunks
+        self.code_chunks: Union[List[Dict[str, Any]], ChunkSubset] = []
+        self.doc_chunks: Union[List[Dict[str, Any]], ChunkSubset] = []
+
+        # Columnar copy of the filterable chunk fields, plus the positions of
+        # code and documentation chunks within self.chunks
+        self.columns: ChunkColumns = ChunkColumns()
+        self.code_ids: np.ndarray = np.empty(0, dtype=np.int64)
+        self.doc_ids: np.ndarray = np.empty(0, dtype=np.int64)
+
+        # Whether self.index reads its codes from a memory-mapped file, in
+        # which case it must be copied into memory before anything is added
+        self._index_mapped: bool = False
+
+        # ID selectors restricting searches to code or documentation chunks,
+        # built on first use and dropped whenever the positions change
+        self._selectors: Dict[str, faiss.IDSelector] = {}
+
+        # Display strings of recently returned chunks by position, least
+        # recently used first and capped at DISPLAY_CACHE_SIZE entries
+        self._display_contents: "OrderedDict[int, str]" = OrderedDict()
 
         # Create data directory if it doesn't exist
         os.makedirs(data_dir, exist_ok=True)
 
+        # Chunk embeddings persisted across runs, keyed by content hash. The
+        # database is only opened once chunks are embedded, so engines that
+        # just serve a saved index never create or write it.
+        self._embedding_cache: Optional[EmbeddingCache] = None
+
         # Initialize FAISS indices
         self._init_indices()
 
+    @property
+    def embedding_cache(self) -> EmbeddingCache:
+        """Return the embedding cache of data_dir, opening it on first use."""
+        if self._embedding_cache is None:
+            self._embedding_cache = EmbeddingCache(
+                os.path.join(self.data_dir, "embeddings.sqlite"), self.model_name
+            )
+        return self._embedding_cache
+
     def _init_indices(self) -> None:
-        """Initialize FAISS indices for vector similarity search."""
-        # Create a flat index using inner product (equivalent to cosine similarity on normalized vectors)
-        self.index = faiss.IndexFlatIP(self.dimension)
-        self.code_index = faiss.IndexFlatIP(self.dimension)
-        self.doc_index = faiss.IndexFlatIP(self.dimension)
+        """Initialize the FAISS index for vector similarity search."""
+        self.index = self._create_index()
+        self._index_mapped = False
 
         # Use GPU if requested and available
         if self.use_gpu:
             try:
                 gpu_resources = faiss.StandardGpuResources()
                 self.index = faiss.index_cpu_to_gpu(gpu_resources, 0, self.index)
-                self.code_index = faiss.index_cpu_to_gpu(
-                    gpu_resources, 0, self.code_index
-                )
-                self.doc_index = faiss.index_cpu_to_gpu(
-                    gpu_resources, 0, self.doc_index
-                )
                 logger.info("Using GPU acceleration for FAISS")
             except Exception as e:
                 logger.warning(
@@ -80,6 +145,53 @@ class FaissSearchEngine:
                 )
                 self.use_gpu = False
 
+    def _create_index(self) -> faiss.Index:
+        """
+        Create an empty index for the configured index type and vector storage.
+
+        Returns:
+            Flat or HNSW inner product index (equivalent to cosine similarity
+            on normalized vectors), scalar quantized if requested
+        """
+        hnsw = self.index_type == "hnsw"
+
+        if self.quantization is None:
+            if hnsw:
+                index = faiss.IndexHNSWFlat(
+                    self.dimension, self.HNSW_M, faiss.METRIC_INNER_PRODUCT
+                )
+            else:
+                return faiss.IndexFlatIP(self.dimension)
+        else:
+            qtype = (
+                faiss.ScalarQuantizer.QT_fp16
+                if self.quantization == "fp16"
+                else faiss.ScalarQuantizer.QT_8bit_uniform
+            )
+            if hnsw:
+                index = faiss.IndexHNSWSQ(
+                    self.dimension, qtype, self.HNSW_M, faiss.METRIC_INNER_PRODUCT
+                )
+                sq = faiss.downcast_index(index.storage).sq
+            else:
+                index = faiss.IndexScalarQuantizer(
+                    self.dimension, qtype, faiss.METRIC_INNER_PRODUCT
+                )
+                sq = index.sq
+
+            if self.quantization == "int8":
+                # Normalized embeddings lie in [-1, 1], so the int8 grid can be
+                # fixed up front instead of being trained on the (still empty)
+                # corpus
+                sq.rangestat = faiss.ScalarQuantizer.RS_minmax
+                bounds = np.array([[-1.0], [1.0]], dtype=np.float32)
+                index.train(np.repeat(bounds, self.dimension, axis=1))
+
+        if hnsw:
+            index.hnsw.efConstruction = self.HNSW_EF_CONSTRUCTION
+            index.hnsw.efSearch = self.HNSW_EF_SEARCH
+        return index
+
     def add_chunks(self, chunks: List[Dict[str, Any]]) -> None:
         """
         Add chunks to the search index.
@@ -93,42 +205,39 @@ class FaissSearchEngine:
 
         # Get text representations for embeddings
         texts = [self._get_text_for_embedding(chunk) for chunk in chunks]
-
-        # Generate embeddings (normalized for cosine similarity)
-        logger.info(f"Generating embeddings for {len(texts)} chunks...")
-        embeddings = self.model.encode(
-            texts, normalize_embeddings=True, show_progress_bar=True, batch_size=32
-        )
+        embeddings = self._embed_texts(texts)
 
         # Add to the combined index
+        base_id = len(self.chunks)
         if self.index is not None:
-            self.index.add(np.array(embeddings).astype("float32"))
+            self._own_index()
+            self.index.add(embeddings)
             self.chunks.extend(chunks)
+            self.columns.extend(chunks)
 
-        # Separate and add to content-specific indices
-        code_chunks: List[Dict[str, Any]] = []
-        code_embeddings: List[np.ndarray] = []
-        doc_chunks: List[Dict[str, Any]] = []
-        doc_embeddings: List[np.ndarray] = []
-
+        # Record the positions of code and documentation chunks; both are
+        # searched through the combined index
+        code_positions: List[int] = []
+        doc_positions: List[int] = []
         for i, chunk in enumerate(chunks):
             content_type = chunk.get("content_type", "")
             if content_type == "code":
-                code_chunks.append(chunk)
-                code_embeddings.append(embeddings[i])
+                code_positions.append(i)
             elif content_type == "documentation":
-                doc_chunks.append(chunk)
-                doc_embeddings.append(embeddings[i])
+                doc_positions.append(i)
 
-        # Add to code index if we have code chunks
-        if code_chunks and self.code_index is not None:
-            self.code_index.add(np.array(code_embeddings).astype("float32"))
-            self.code_chunks.extend(code_chunks)
+        if code_positions:
+            self.code_chunks.extend([chunks[i] for i in code_positions])
+            self.code_ids = np.concatenate(
+                [self.code_ids, base_id + np.array(code_positions, dtype=np.int64)]
+            )
 
-        # Add to documentation index if we have doc chunks
-        if doc_chunks and self.doc_index is not None:
-            self.doc_index.add(np.array(doc_embeddings).astype("float32"))
-            self.doc_chunks.extend(doc_chunks)
+        if doc_positions:
+            self.doc_chunks.extend([chunks[i] for i in doc_positions])
+            self.doc_ids = np.concatenate(
+                [self.doc_ids, base_id + np.array(doc_positions, dtype=np.int64)]
+            )
+        self._selectors.clear()
 
         logger.info(
             f"Added {len(chunks)} chunks to index. "
@@ -136,6 +245,48 @@ class FaissSearchEngine:
             f"({len(self.code_chunks)} code, {len(self.doc_chunks)} documentation)."
         )
 
+    def merge_from(self, other: "FaissSearchEngine") -> None:
+        """
+        Append the chunks and vectors of another engine to this one.
+
+        Vectors are copied out of the other index, so the merged chunks are
+        neither re-processed nor re-embedded.
+
+        Args:
+            other: Engine built with the same model
+        """
+        if other.model_name != self.model_name or other.dimension != self.dimension:
+            raise ValueError(
+                f"Cannot merge an index built with {other.model_name} "
+                f"into one built with {self.model_name}"
+            )
+        if not len(other.chunks):
+            return
+
+        base_id = len(self.chunks)
+        self._own_index()
+        self.index.add(other.index.reconstruct_n(0, other.index.ntotal))
+        self.chunks.extend(list(other.chunks))
+        self.columns.extend_columns(other.columns)
+
+        self.code_chunks.extend(list(other.code_chunks))
+        self.doc_chunks.extend(list(other.doc_chunks))
+        self.code_ids = np.concatenate([self.code_ids, base_id + other.code_ids])
+        self.doc_ids = np.concatenate([self.doc_ids, base_id + other.doc_ids])
+        self._selectors.clear()
+
+        logger.info(
+            f"Merged {len(other.chunks)} chunks into index. "
+            f"Total: {len(self.chunks)} chunks."
+        )
+
+    def _own_index(self) -> None:
+        """Copy a memory-mapped index into memory, so that it can be extended."""
+        if self._index_mapped:
+            # Mapped codes are read-only views; adding to them aborts in FAISS
+            self.index = faiss.deserialize_index(faiss.serialize_index(self.index))
+            self._index_mapped = False
+
     def search(
         self,
         query: str,
@@ -153,72 +304,184 @@ class FaissSearchEngine:
             min_score: Minimum similarity score to include in results
 
         Returns:
-            List of search results with similarity scores
+            List of search results with similarity scores. Each result carries
+            the chunk's position in self.chunks as "chunk_id".
+        """
+        results = self.search_batch([query], top_k, content_filter, min_score)
+        return results[0] if results else []
+
+    def search_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        content_filter: Optional[str] = None,
+        min_score: float = 0.0,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for chunks relevant to several queries at once.
+
+        All queries are encoded in one model call and looked up in one index
+        search, which amortizes the per-call overhead of both.
+
+        Args:
+            queries: Search queries
+            top_k: Number of top results to return per query
+            content_filter: Filter by content type ('code' or 'documentation')
+            min_score: Minimum similarity score to include in results
+
+        Returns:
+            One list of search results per query, as returned by search
         """
         # Try to load index if not initialized
         if self.index is None or (self.index is not None and self.index.ntotal == 0):
-            if not self._load_index():
+            if not self.load_index():
                 logger.warning("No index available. Please build the index first.")
                 return []
 
-        # Encode the query
-        query_embedding = self.model.encode([query], normalize_embeddings=True)
-        query_embedding = np.array(query_embedding).astype("float32")
-
-        # Determine which index to search based on content filter
-        index_to_search = None
-        chunks_to_search: List[Dict[str, Any]] = []
+        if self.index is None or not queries:
+            return []
 
-        if (
-            content_filter == "code"
-            and self.code_index is not None
-            and self.code_index.ntotal > 0
-        ):
-            logger.info(f"Searching for '{query}' in code index only...")
-            index_to_search = self.code_index
-            chunks_to_search = self.code_chunks
-        elif (
-            content_filter == "documentation"
-            and self.doc_index is not None
-            and self.doc_index.ntotal > 0
-        ):
-            logger.info(f"Searching for '{query}' in documentation index only...")
-            index_to_search = self.doc_index
-            chunks_to_search = self.doc_chunks
+        # Encode the queries
+        query_embeddings = self.model.encode(
+            queries,
+            batch_size=self.MODEL_BATCH_SIZE,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+        query_embeddings = np.asarray(query_embeddings, dtype=np.float32)
+
+        # Restrict the combined index to the requested content type, if any
+        # chunks of that type exist
+        filter_ids: Optional[np.ndarray] = None
+        if content_filter == "code" and len(self.code_ids) > 0:
+            logger.info(f"Searching {len(queries)} queries in code chunks only...")
+            filter_ids = self.code_ids
+        elif content_filter == "documentation" and len(self.doc_ids) > 0:
+            logger.info(
+                f"Searching {len(queries)} queries in documentation chunks only..."
+            )
+            filter_ids = self.doc_ids
         else:
-            logger.info(f"Searching for '{query}' in all content...")
-            index_to_search = self.index
-            chunks_to_search = self.chunks
+            logger.info(f"Searching {len(queries)} queries in all content...")
 
-        if index_to_search is None:
-            return []
-
-        # Search the index
-        scores, indices = index_to_search.search(
-            query_embedding, k=top_k * 2
-        )  # Get more than needed for filtering
+        # Content filtering happens inside the index search and results come
+        # back sorted by score, so top_k neighbours are all that is needed
+        scores, indices = self._search_index(
+            query_embeddings, top_k, content_filter, filter_ids
+        )
 
         # Build results
-        results: List[Dict[str, Any]] = []
-        for i, (idx, score) in enumerate(zip(indices[0], scores[0])):
-            # Break if we've collected enough results or if score is below threshold
-            if len(results) >= top_k or score < min_score:
-                break
-
-            if idx < 0 or idx >= len(chunks_to_search):
-                continue  # Skip invalid indices
-
-            chunk = chunks_to_search[idx]
-            result = {
-                "chunk": chunk,
-                "score": float(score),
-                "content": self._get_display_content(chunk),
-            }
-            results.append(result)
-
-        return results
-
-    def build_index(self):
+        batch_results: List[List[Dict[str, Any]]] = []
+        for row_indices, row_scores in zip(indices, scores):
+            results: List[Dict[str, Any]] = []
+            for idx, score in zip(row_indices, row_scores):
+                # Scores are sorted, so stop at the first one below threshold
+                if score < min_score:
+                    break
+
+                if idx < 0 or idx >= len(self.chunks):
+                    continue  # Skip invalid indices
+
+                chunk_id = int(idx)
+                chunk = self.chunks[chunk_id]
+                content = self._display_contents.get(chunk_id)
+                if content is None:
+                    content = self._get_display_content(chunk)
+                    self._display_contents[chunk_id] = content
+                    if len(self._display_contents) > self.DISPLAY_CACHE_SIZE:
+                        self._display_contents.popitem(last=False)
+                else:
+                    self._display_contents.move_to_end(chunk_id)
+                result = {
+                    "chunk": chunk,
+                    "chunk_id": chunk_id,
+                    "score": float(score),
+                    "content": content,
+                }
+                results.append(result)
+            batch_results.append(results)
+
+        return batch_results
+
+    def _search_index(
+        self,
+        query_embeddings: np.ndarray,
+        k: int,
+        content_filter: Optional[str],
+        filter_ids: Optional[np.ndarray],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search the combined index, optionally restricted to some chunks.
+
+        Args:
+            query_embeddings: Normalized query embeddings, one row per query
+            k: Number of neighbours to retrieve
+            content_filter: Content type the chunks are restricted to
+            filter_ids: Positions of the allowed chunks, or None for all chunks
+
+        Returns:
+            Scores and chunk positions of the nearest neighbours, one row
+            per query
+        """
+        if filter_ids is None:
+            return self.index.search(query_embeddings, k)
+
+        if self.use_gpu:
+            # GPU indices do not take ID selectors, so over-fetch and drop
+            # neighbours of the wrong content type afterwards
+            scores, indices = self.index.search(
+                query_embeddings, min(self.index.ntotal, k * 4)
+            )
+            # Move the allowed neighbours of each query to the front, keeping
+            # their order, and mark the rest as missing
+            keep = np.isin(indices, filter_ids)
+            order = np.argsort(~keep, axis=1, kind="stable")[:, :k]
+            keep = np.take_along_axis(keep, order, axis=1)
+            scores = np.where(keep, np.take_along_axis(scores, order, axis=1), -np.inf)
+            indices = np.where(keep, np.take_along_axis(indices, order, axis=1), -1)
+            return scores, indices
+
+        selector = self._selectors.get(content_filter)
+        if selector is None:
+            selector = faiss.IDSelectorBatch(filter_ids)
+            self._selectors[content_filter] = selector
+        params = faiss.SearchParameters(sel=selector)
+        return self.index.search(query_embeddings, k, params=params)
+
+    def match_chunks(
+        self,
+        ids: np.ndarray,
+        type_filter: Optional[str] = None,
+        param_type: Optional[str] = None,
+        param_name: Optional[str] = None,
+        return_type: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Evaluate type and signature filters over indexed chunks.
+
+        Filters run over the columnar chunk fields, so no chunk dict is
+        decoded. Signature needles must already be lowercased.
+
+        Args:
+            ids: Positions of the candidate chunks in self.chunks
+            type_filter: Required chunk type
+            param_type: Substring required in some parameter type
+            param_name: Substring required in some parameter name
+            return_type: Substring required in the return type
+
+        Returns:
+            Boolean mask aligned with ids
+        """
+        return self.columns.match(
+            ids,
+            type_filter=type_filter,
+            param_type=param_type,
+            param_name=param_name,
+            return_type=return_type,
+        )
+
+    def build_index(self) -> None:
         """Build the search index and save it to disk."""
         if not self.chunks:
             logger.warning("No chunks to index.")
@@ -233,12 +496,46 @@ class FaissSearchEngine:
             f"({len(self.code_chunks)} code, {len(self.doc_chunks)} documentation)."
         )
 
+    def reset(self) -> None:
+        """
+        Drop all indexed chunks and delete the saved index.
+
+        The loaded model and the embedding cache are kept on purpose: cache
+        entries are keyed by model and text hash, so they stay valid, and
+        chunks that are added again are not re-encoded. The cache bounds its
+        own size (see EmbeddingCache.MAX_ENTRIES).
+        """
+        self.chunks = []
+        self.code_chunks = []
+        self.doc_chunks = []
+        self.index_metadata = {}
+        self.columns = ChunkColumns()
+        self.code_ids = np.empty(0, dtype=np.int64)
+        self.doc_ids = np.empty(0, dtype=np.int64)
+        self._selectors.clear()
+        self._display_contents.clear()
+        self._init_indices()
+
+        for filename in (
+            "index_metadata.json",
+            "chunks.json",
+            "chunks.bin",
+            "chunk_offsets.npy",
+            "chunk_columns.bin",
+            "faiss_index.bin",
+        ):
+            file_path = os.path.join(self.data_dir, filename)
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
     def _save_index(self):
         """Save the search indices and data to disk."""
         # Save metadata about the indices
         metadata = {
             "model_name": self.model_name,
             "dimension": self.dimension,
+            "quantization": self.quantization,
+            "index_type": self.index_type,
             "total_chunks": len(self.chunks),
             "code_chunks": len(self.code_chunks),
             "doc_chunks": len(self.doc_chunks),
@@ -248,33 +545,34 @@ class FaissSearchEngine:
         with open(metadata_file, "w", encoding="utf-8") as f:
             json.dump(metadata, f, indent=2)
 
-        # Save chunks
-        self._save_chunks(self.chunks, "chunks.json")
-        self._save_chunks(self.code_chunks, "code_chunks.json")
-        self._save_chunks(self.doc_chunks, "doc_chunks.json")
+        # Save the memory-mappable chunk store and its filter columns; code
+        # and documentation chunks are derived from the columns on load, so
+        # they are not written separately
+        MappedChunks.write(
+            self.chunks,
+            os.path.join(self.data_dir, "chunks.bin"),
+            os.path.join(self.data_dir, "chunk_offsets.npy"),
+        )
+        self.columns.save(os.path.join(self.data_dir, "chunk_columns.bin"))
 
-        # Save indices
+        # Save the combined index; code and documentation searches filter it
         self._save_faiss_index(self.index, "faiss_index.bin")
-        self._save_faiss_index(self.code_index, "faiss_code_index.bin")
-        self._save_faiss_index(self.doc_index, "faiss_doc_index.bin")
 
         logger.info(f"Saved index to {self.data_dir}")
 
-    def _save_chunks(self, chunks: List[Dict[str, Any]], filename: str):
-        """Save chunks to a JSON file."""
-        file_path = os.path.join(self.data_dir, filename)
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(chunks, f, indent=2)
-
     def _save_faiss_index(self, index, filename: str):
         """Save a FAISS index to disk."""
         file_path = os.path.join(self.data_dir, filename)
         if self.use_gpu:
             # Convert GPU index to CPU for storage
             index = faiss.index_gpu_to_cpu(index)
+        # Unlink rather than truncate, so an index mapped from this file by
+        # load_index keeps reading its old data while the new one is written
+        if os.path.exists(file_path):
+            os.remove(file_path)
         faiss.write_index(index, file_path)
 
-    def _load_index(self) -> bool:
+    def load_index(self) -> bool:
         """
         Load the search indices from disk.
 
@@ -297,15 +595,20 @@ class FaissSearchEngine:
                     f"Index was built with a different model: {self.index_metadata.get('model_name')}"
                 )
 
-            # Load chunks
-            self._load_chunks("chunks.json", target="all")
-            self._load_chunks("code_chunks.json", target="code")
-            self._load_chunks("doc_chunks.json", target="doc")
+            # Load the combined index
+            self._load_faiss_index("faiss_index.bin")
+            self._display_contents.clear()
+
+            # Load chunks from the memory-mapped store, falling back to the
+            # chunks.json written by older versions
+            if not self._load_mapped_chunks():
+                self._load_chunks("chunks.json")
 
-            # Load indices
-            self._load_faiss_index("faiss_index.bin", target="all")
-            self._load_faiss_index("faiss_code_index.bin", target="code")
-            self._load_faiss_index("faiss_doc_index.bin", target="doc")
+                # Rebuild the filter columns from the loaded chunks
+                self.columns = ChunkColumns.from_chunks(self.chunks)
+                self._build_content_ids()
+                self.code_chunks = ChunkSubset(self.chunks, self.code_ids)
+                self.doc_chunks = ChunkSubset(self.chunks, self.doc_ids)
 
             logger.info(
                 f"Loaded index with {len(self.chunks)} chunks "
@@ -317,42 +620,128 @@ class FaissSearchEngine:
             logger.error(f"Error loading index: {str(e)}")
             return False
 
-    def _load_chunks(self, filename: str, target: str):
+    def _load_mapped_chunks(self) -> bool:
+        """
+        Open the memory-mapped chunk store and its filter columns.
+
+        Chunk dicts are decoded lazily on access rather than loaded up front.
+        Columns that are missing or saved in an older layout are rebuilt from
+        the store.
+
+        Returns:
+            True if the store was found and opened, False otherwise
+        """
+        payload_file = os.path.join(self.data_dir, "chunks.bin")
+        offsets_file = os.path.join(self.data_dir, "chunk_offsets.npy")
+        columns_file = os.path.join(self.data_dir, "chunk_columns.bin")
+        if not (os.path.exists(payload_file) and os.path.exists(offsets_file)):
+            return False
+
+        self.chunks = MappedChunks(payload_file, offsets_file)
+        try:
+            self.columns = ChunkColumns.load(columns_file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"{e}; rebuilding the columns from {payload_file}")
+            self.columns = ChunkColumns.from_chunks(self.chunks)
+        self._build_content_ids()
+        self.code_chunks = ChunkSubset(self.chunks, self.code_ids)
+        self.doc_chunks = ChunkSubset(self.chunks, self.doc_ids)
+        return True
+
+    def _build_content_ids(self) -> None:
+        """Derive the positions of code and documentation chunks from the columns."""
+        # Code and documentation chunks are stored in the same relative order
+        # as in self.chunks, so their positions can be derived from the columns
+        self.code_ids = np.flatnonzero(self.columns.mask_equal("content_types", "code"))
+        self.doc_ids = np.flatnonzero(
+            self.columns.mask_equal("content_types", "documentation")
+        )
+        self._selectors.clear()
+
+    def _load_chunks(self, filename: str):
         """Load chunks from a JSON file."""
         file_path = os.path.join(self.data_dir, filename)
         if os.path.exists(file_path):
             with open(file_path, "r", encoding="utf-8") as f:
-                chunks = json.load(f)
-
-                if target == "all":
-                    self.chunks = chunks
-                elif target == "code":
-                    self.code_chunks = chunks
-                elif target == "doc":
-                    self.doc_chunks = chunks
+                self.chunks = json.load(f)
 
-    def _load_faiss_index(self, filename: str, target: str):
+    def _load_faiss_index(self, filename: str):
         """Load a FAISS index from disk."""
         file_path = os.path.join(self.data_dir, filename)
         if os.path.exists(file_path):
-            index = faiss.read_index(file_path)
+            # Map the vector codes instead of reading them, so the OS pages
+            # them in on demand rather than copying the whole file at startup
+            index = faiss.read_index(file_path, faiss.IO_FLAG_MMAP_IFC)
+            mapped = True
 
             # Convert to GPU if requested
             if self.use_gpu:
                 try:
                     gpu_resources = faiss.StandardGpuResources()
                     index = faiss.index_cpu_to_gpu(gpu_resources, 0, index)
+                    mapped = False
                 except Exception as e:
                     logger.warning(
                         f"Failed to use GPU for index {filename}: {str(e)}. Using CPU."
                     )
 
-            if target == "all":
-                self.index = index
-            elif target == "code":
-                self.code_index = index
-            elif target == "doc":
-                self.doc_index = index
+            self.index = index
+            self._index_mapped = mapped
+
+    def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts, reusing cached embeddings of previously seen texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Normalized float32 embeddings aligned with texts
+        """
+        hashes = [EmbeddingCache.hash_text(text) for text in texts]
+        cached = self.embedding_cache.get_many(hashes)
+
+        # Encode each distinct uncached text once
+        missing = list(dict.fromkeys(h for h in hashes if h not in cached))
+        if missing:
+            missing_texts = {h: text for h, text in zip(hashes, texts)}
+            # Generate embeddings (normalized for cosine similarity)
+            logger.info(
+                f"Generating embeddings for {len(missing)} chunks "
+                f"({len(texts) - len(missing)} cached)..."
+            )
+            new_embeddings = self._encode_texts([missing_texts[h] for h in missing])
+            self.embedding_cache.put_many(missing, new_embeddings)
+            cached.update(zip(missing, new_embeddings))
+        else:
+            logger.info(f"Reusing cached embeddings for {len(texts)} chunks")
+
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for i, text_hash in enumerate(hashes):
+            embeddings[i] = cached[text_hash]
+        return embeddings
+
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts with a single model call.
+
+        The model batches the texts internally and torch already spreads each
+        forward pass over several CPU threads, so the call is not split up.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            Normalized float32 embeddings aligned with texts
+        """
+        embeddings = self.model.encode(
+            texts,
+            batch_size=self.MODEL_BATCH_SIZE,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+        return np.asarray(embeddings, dtype=np.float32)
 
     def _get_text_for_embedding(self, chunk: Dict[str, Any]) -> str:
         """
@@ -2,12 +2,12 @@
 
 import os
 import logging
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Callable
+import numpy as np
 
+from src.search.backend import SearchBackend
 from src.search.faiss_search import FaissSearchEngine
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -20,6 +20,8 @@ class SearchEngine:
         data_dir: str = "data/processed",
         use_gpu: bool = False,
         use_faiss: bool = True,
+        quantization: Optional[str] = None,
+        index_type: str = "flat",
     ):
         """
         Initialize the search engine.
@@ -29,11 +31,15 @@ class SearchEngine:
             data_dir: Directory to store processed data
             use_gpu: Whether to use GPU for embedding and search
             use_faiss: Whether to use FAISS for vector search
+            quantization: Store vectors as 'fp16' or 'int8' instead of float32
+            index_type: 'flat' for exact search or 'hnsw' for approximate search
         """
         self.model_name = model_name
         self.data_dir = data_dir
         self.use_gpu = use_gpu
         self.use_faiss = use_faiss
+        self.quantization = quantization
+        self.index_type = index_type
 
         # Create data directory if it doesn't exist
         os.makedirs(data_dir, exist_ok=True)
@@ -42,20 +48,55 @@ class SearchEngine:
         self._init_search_backend()
 
         logger.info(
-            f"Initialized SearchEngine with model {model_name} {'with GPU' if use_gpu else 'without GPU'}"
+            "Initialized SearchEngine with model %s %s",
+            model_name,
+            "with GPU" if use_gpu else "without GPU",
         )
 
+    @classmethod
+    def load(cls, data_dir: str, **kwargs: Any) -> "SearchEngine":
+        """
+        Open a search index previously saved to a data directory.
+
+        The chunk store and the index's vector codes are memory-mapped rather
+        than read into memory, so several engines can share one saved index
+        cheaply; only the filter columns are loaded up front. Adding chunks
+        to the engine first copies the index into memory.
+
+        Args:
+            data_dir: Directory the index was saved to
+            **kwargs: Other SearchEngine arguments, which must match those the
+                index was built with
+
+        Returns:
+            Search engine serving the saved index
+
+        Raises:
+            ValueError: If no index could be loaded from data_dir
+        """
+        engine = cls(data_dir=data_dir, **kwargs)
+        if not engine.load_index():
+            raise ValueError(f"No loadable search index in {data_dir}")
+        return engine
+
     def _init_search_backend(self):
         """Initialize the search backend based on configuration."""
         if self.use_faiss:
             logger.info("Using FAISS search backend")
-            self.backend = FaissSearchEngine(
-                model_name=self.model_name, data_dir=self.data_dir, use_gpu=self.use_gpu
+            self.backend: SearchBackend = FaissSearchEngine(
+                model_name=self.model_name,
+                data_dir=self.data_dir,
+                use_gpu=self.use_gpu,
+                quantization=self.quantization,
+                index_type=self.index_type,
             )
         else:
             # Fallback to a simpler vector search if FAISS is not available
             raise NotImplementedError("Non-FAISS backend is not implemented yet")
 
+        # Bind the loader once instead of looking it up on every call
+        self._load_index_fn: Callable[[], bool] = self.backend.load_index
+
     def add_chunks(self, chunks: List[Dict[str, Any]]):
         """
         Add processed chunks to the search index.
@@ -65,6 +106,33 @@ class SearchEngine:
         """
         self.backend.add_chunks(chunks)
 
+    def bulk_index(self, chunks: List[Dict[str, Any]], flush: bool = True):
+        """
+        Add processed chunks in a single batch and optionally save the index.
+
+        Several batches can be added with flush=False and written to disk
+        once by the last call (or by build_index).
+
+        Args:
+            chunks: List of processed document chunks
+            flush: Whether to build and save the index after adding the chunks
+        """
+        self.backend.add_chunks(chunks)
+        if flush:
+            self.backend.build_index()
+
+    def merge_from(self, other: "SearchEngine"):
+        """
+        Append the indexed chunks of another search engine to this one.
+
+        The merged chunks are not re-processed or re-embedded. Call
+        build_index afterwards to save the merged index.
+
+        Args:
+            other: Search engine using the same model
+        """
+        self.backend.merge_from(other.backend)
+
     def search(
         self,
         query: str,
@@ -88,6 +156,15 @@ class SearchEngine:
         Returns:
             List of search results with similarity scores
         """
+        # Without local filters the backend results are already final
+        if not type_filter and not signature_filter:
+            return self.backend.search(
+                query=query,
+                top_k=top_k,
+                content_filter=content_filter,
+                min_score=min_score,
+            )
+
         # Get basic search results from the backend
         results = self.backend.search(
             query=query,
@@ -96,92 +173,131 @@ class SearchEngine:
             min_score=min_score,
         )
 
-        # Apply additional filters locally
-        filtered_results = []
-        for result in results:
-            chunk = result.get("chunk", {})
+        # Compile the signature filter once for all candidates
+        signature_matches = (
+            self._compile_signature_filter(signature_filter)
+            if signature_filter
+            else None
+        )
+        return self._filter_results(results, top_k, type_filter, signature_matches)
+
+    def search_many(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        content_filter: Optional[str] = None,
+        min_score: float = 0.0,
+        type_filter: Optional[str] = None,
+        signature_filter: Optional[Dict[str, str]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for chunks relevant to several queries at once.
+
+        The queries are embedded and looked up by the backend in a single
+        batch; filters are compiled once and applied to every result list.
 
-            # Apply type filter if specified
-            if type_filter and chunk.get("type") != type_filter:
-                continue
+        Args:
+            queries: Search queries
+            top_k: Number of results to return per query
+            content_filter: Filter results by content type ('code' or 'documentation')
+            min_score: Minimum similarity score threshold
+            type_filter: Filter by Python type (function, class, method, module)
+            signature_filter: Filter by function signature (e.g. parameter or return types)
+
+        Returns:
+            One list of search results per query, as returned by search
+        """
+        filtered = bool(type_filter or signature_filter)
+        batches = self.backend.search_batch(
+            queries=queries,
+            top_k=top_k * 3 if filtered else top_k,
+            content_filter=content_filter,
+            min_score=min_score,
+        )
+        # The backend returns no lists at all when it has no index
+        batches = batches or [[] for _ in queries]
+        if not filtered:
+            return batches
+
+        signature_matches = (
+            self._compile_signature_filter(signature_filter)
+            if signature_filter
+            else None
+        )
+        return [
+            self._filter_results(results, top_k, type_filter, signature_matches)
+            for results in batches
+        ]
 
-            # Apply signature filter if specified
-            if signature_filter and not self._matches_signature_filter(
-                chunk, signature_filter
-            ):
-                continue
+    def _filter_results(
+        self,
+        results: List[Dict[str, Any]],
+        top_k: int,
+        type_filter: Optional[str],
+        signature_matches: Optional[Callable[[np.ndarray], np.ndarray]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply the local type and signature filters to backend results.
 
-            filtered_results.append(result)
+        Args:
+            results: Backend search results
+            top_k: Number of results to keep
+            type_filter: Required chunk type
+            signature_matches: Compiled signature filter
 
-            # Stop once we have enough results
-            if len(filtered_results) >= top_k:
-                break
+        Returns:
+            The first top_k results that pass the filters
+        """
+        # Apply additional filters locally through the backend
+        ids = np.fromiter(
+            (result["chunk_id"] for result in results),
+            dtype=np.int64,
+            count=len(results),
+        )
+        mask = self.backend.match_chunks(ids, type_filter=type_filter or None)
+        if signature_matches is not None:
+            mask &= signature_matches(ids)
 
+        filtered_results = [result for result, keep in zip(results, mask) if keep]
         return filtered_results[:top_k]
 
-    def _matches_signature_filter(
-        self, chunk: Dict[str, Any], signature_filter: Dict[str, str]
-    ) -> bool:
+    def _compile_signature_filter(
+        self, signature_filter: Dict[str, str]
+    ) -> Callable[[np.ndarray], np.ndarray]:
         """
-        Check if a chunk matches the given signature filter.
+        Compile a signature filter into a predicate over chunk ids.
+
+        The filter values are lowercased once here so that the returned
+        predicate can be applied to every batch of candidates without
+        re-reading the filter dictionary.
 
         Args:
-            chunk: The chunk to check
             signature_filter: The signature filter to apply
 
         Returns:
-            True if the chunk matches the filter, False otherwise
-        """
-        # For non-function chunks, no signature to match
-        if chunk.get("type") not in ["function", "method"]:
-            return False
-
-        # Get parameters list from either "parameters" or "params" field
-        parameters = chunk.get("parameters", chunk.get("params", []))
-
-        # Check parameter type
-        if "param_type" in signature_filter:
-            param_type = signature_filter["param_type"]
-            found = False
-            for param in parameters:
-                # Case insensitive matching for parameter type
-                param_type_value = param.get("type", "")
-                if param_type_value and param_type.lower() in param_type_value.lower():
-                    found = True
-                    break
-            if not found:
-                return False
-
-        # Check parameter name
-        if "param_name" in signature_filter:
-            param_name = signature_filter["param_name"]
-            found = False
-            for param in parameters:
-                # Case insensitive matching for parameter name
-                param_name_value = param.get("name", "")
-                if param_name_value and param_name.lower() in param_name_value.lower():
-                    found = True
-                    break
-            if not found:
-                return False
-
-        # Check return type
-        if "return_type" in signature_filter:
-            return_type = signature_filter["return_type"]
-            function_return_type = chunk.get("return_type", chunk.get("returns", ""))
-            # Case insensitive matching for return type
-            if (
-                not function_return_type
-                or return_type.lower() not in function_return_type.lower()
-            ):
-                return False
-
-        return True
+            Function mapping an array of chunk ids to a boolean match mask
+        """
+        # Pre-lower the needles; keys absent from the filter are not matched on
+        needles = {
+            key: signature_filter[key].lower()
+            for key in ("param_type", "param_name", "return_type")
+            if key in signature_filter
+        }
+        match_chunks = self.backend.match_chunks
+
+        def matches(ids: np.ndarray) -> np.ndarray:
+            return match_chunks(ids, **needles)
+
+        return matches
 
     def build_index(self):
         """Build the search index from added chunks."""
         self.backend.build_index()
 
+    def reset(self):
+        """Drop all indexed chunks and delete the saved index, keeping the model."""
+        self.backend.reset()
+
     def load_index(self) -> bool:
         """
         Load a pre-built search index.
@@ -189,6 +305,4 @@ class SearchEngine:
         Returns:
             True if index was loaded successfully, False otherwise
         """
-        if hasattr(self.backend, "_load_index"):
-            return self.backend._load_index()
-        return False
+        return self._load_index_fn()
@@ -5,6 +5,16 @@ import pytest
 import tempfile
 from pathlib import Path
 
+from src.extractors.python_extractor import PythonExtractor
+from src.extractors.rst_extractor import RSTExtractor
+
+# RAM-backed location for short-lived test data, when the platform has one
+_RAM_TMP_DIR = (
+    "/dev/shm"
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)
+    else None
+)
+
 
 @pytest.fixture
 def test_data_dir():
@@ -12,17 +22,43 @@ def test_data_dir():
     return os.path.join(os.path.dirname(__file__), "test_data")
 
 
+@pytest.fixture(scope="session")
+def worker_tmp_dir(tmp_path_factory):
+    """
+    Return a stable temporary directory for the current test worker.
+
+    Under pytest-xdist each worker (gw0, gw1, ...) gets its own directory,
+    so module-scoped sample files can use fixed names without colliding.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    path = tmp_path_factory.getbasetemp() / worker
+    path.mkdir(exist_ok=True)
+    return path
+
+
+@pytest.fixture(scope="session")
+def python_extractor():
+    """Create a PythonExtractor shared by the whole test session."""
+    return PythonExtractor()
+
+
+@pytest.fixture(scope="session")
+def rst_extractor():
+    """Create an RSTExtractor shared by the whole test session."""
+    return RSTExtractor()
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with tempfile.TemporaryDirectory(dir=_RAM_TMP_DIR) as tmpdir:
         yield tmpdir
 
 
-@pytest.fixture
-def temp_python_file(temp_dir):
-    """Create a temporary Python file for testing."""
-    file_path = os.path.join(temp_dir, "test_file.py")
+@pytest.fixture(scope="session")
+def temp_python_file(worker_tmp_dir):
+    """Create a temporary Python file shared by the whole test session."""
+    file_path = os.path.join(worker_tmp_dir, "test_file.py")
     with open(file_path, "w") as f:
         f.write(
             """
@@ -62,10 +98,10 @@ class SampleClass:
     return file_path
 
 
-@pytest.fixture
-def temp_markdown_file(temp_dir):
-    """Create a temporary Markdown file for testing."""
-    file_path = os.path.join(temp_dir, "test_doc.md")
+@pytest.fixture(scope="session")
+def temp_markdown_file(worker_tmp_dir):
+    """Create a temporary Markdown file shared by the whole test session."""
+    file_path = os.path.join(worker_tmp_dir, "test_doc.md")
     with open(file_path, "w") as f:
         f.write(
             """
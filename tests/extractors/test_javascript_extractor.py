@@ -1,25 +1,15 @@
 """Tests for the JavaScriptExtractor class."""
 
-import os
-import tempfile
+import importlib
+import re
+import sys
+import types
 import pytest
+import src.extractors.javascript_extractor as javascript_extractor
 from src.extractors.javascript_extractor import JavaScriptExtractor
 
 
-class TestJavaScriptExtractor:
-    """Test class for JavaScriptExtractor."""
-
-    @pytest.fixture
-    def js_extractor(self):
-        """Create a JavaScript extractor for testing."""
-        return JavaScriptExtractor()
-
-    @pytest.fixture
-    def temp_js_file(self):
-        """Create a temporary JavaScript file for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".js", delete=False) as f:
-            f.write(
-                b"""/**
+_JS_SAMPLE_BYTES = b"""/**
  * A sample function for testing extraction.
  *
  * @param {string} param1 - First parameter description
@@ -64,16 +54,8 @@ import React from 'react';
 import { useState, useEffect } from 'react';
 import * as utils from './utils';
 """
-            )
-        yield f.name
-        os.unlink(f.name)
 
-    @pytest.fixture
-    def temp_jsx_file(self):
-        """Create a temporary JSX file for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".jsx", delete=False) as f:
-            f.write(
-                b"""import React from 'react';
+_JSX_SAMPLE_BYTES = b"""import React from 'react';
 
 /**
  * A sample React component.
@@ -97,19 +79,99 @@ const ArrowComponent = ({ text }) => (
 
 export default SampleComponent;
 """
-            )
-        yield f.name
-        os.unlink(f.name)
+
+_FUNCTIONS_SOURCE = """
+function simpleFunction() {
+    return true;
+}
+
+async function asyncFunction(param) {
+    return await Promise.resolve(param);
+}
+
+export function exportedFunction(a, b) {
+    return a + b;
+}
+"""
+
+_CLASSES_SOURCE = """
+class SimpleClass {
+    constructor() {
+        this.value = 0;
+    }
+
+    method() {
+        return this.value;
+    }
+}
+
+export class ExportedClass extends BaseClass {
+    static staticMethod() {
+        return 'static';
+    }
+
+    instanceMethod() {
+        return 'instance';
+    }
+}
+"""
+
+_COMPONENTS_SOURCE = """
+function FunctionComponent(props) {
+    return <div>{props.text}</div>;
+}
+
+const ArrowComponent = ({ text }) => (
+    <span>{text}</span>
+);
+
+class ClassComponent extends React.Component {
+    render() {
+        return (
+            <div>
+                <h1>{this.props.title}</h1>
+                <p>{this.props.content}</p>
+            </div>
+        );
+    }
+}
+"""
+
+
+class TestJavaScriptExtractor:
+    """Test class for JavaScriptExtractor."""
+
+    @pytest.fixture(scope="module")
+    def js_extractor(self):
+        """Create a JavaScript extractor for testing."""
+        return JavaScriptExtractor()
+
+    @pytest.fixture(scope="module")
+    def temp_js_file(self, worker_tmp_dir):
+        """Create a JavaScript file shared by the tests in this module."""
+        js_file = worker_tmp_dir / "sample.js"
+        js_file.write_bytes(_JS_SAMPLE_BYTES)
+        return str(js_file)
+
+    @pytest.fixture(scope="module")
+    def temp_jsx_file(self, worker_tmp_dir):
+        """Create a JSX file shared by the tests in this module."""
+        jsx_file = worker_tmp_dir / "sample.jsx"
+        jsx_file.write_bytes(_JSX_SAMPLE_BYTES)
+        return str(jsx_file)
 
     def test_initialization(self, js_extractor):
         """Test that JavaScriptExtractor initializes properly."""
-        assert js_extractor.function_pattern is not None
-        assert js_extractor.class_pattern is not None
-        assert js_extractor.method_pattern is not None
-        assert js_extractor.arrow_function_pattern is not None
-        assert js_extractor.import_pattern is not None
-        assert js_extractor.jsx_component_pattern is not None
-        assert js_extractor.jsdoc_pattern is not None
+        for attr in (
+            "function_pattern",
+            "class_pattern",
+            "method_pattern",
+            "arrow_function_pattern",
+            "import_pattern",
+            "jsx_component_pattern",
+            "jsdoc_pattern",
+        ):
+            assert getattr(js_extractor, attr) is not None, attr
 
     def test_extract_from_js_file(self, js_extractor, temp_js_file):
         """Test extraction from a JavaScript file."""
@@ -128,7 +190,8 @@ export default SampleComponent;
         assert len(functions) >= 2  # regular function + arrow function
 
         # Check regular function
-        sample_function = next(f for f in functions if f["name"] == "sampleFunction")
+        functions_by_name = {f["name"]: f for f in functions}
+        sample_function = functions_by_name["sampleFunction"]
         assert sample_function["name"] == "sampleFunction"
         assert "docstring" in sample_function
         assert "params" in sample_function
@@ -290,149 +353,55 @@ export default SampleComponent;
         # If examples are captured, there might be at least one, or it might be empty
         # depending on the implementation
 
-    def test_extract_functions(self, js_extractor):
-        """Test extracting functions."""
-        content = """
-        function simpleFunction() {
-            return true;
-        }
-
-        async function asyncFunction(param) {
-            return await Promise.resolve(param);
-        }
-
-        export function exportedFunction(a, b) {
-            return a + b;
-        }
-        """
-
-        jsdocs = {}  # Empty JSDoc dictionary for this test
-        functions = js_extractor._extract_functions(content, jsdocs)
-
-        assert len(functions) == 3
-
-        function_names = [f["name"] for f in functions]
-        assert "simpleFunction" in function_names
-        assert "asyncFunction" in function_names
-        assert "exportedFunction" in function_names
-
-        # Check for parameters
-        async_function = next(f for f in functions if f["name"] == "asyncFunction")
-        assert len(async_function["params"]) == 1
-
-        exported_function = next(
-            f for f in functions if f["name"] == "exportedFunction"
-        )
-        assert len(exported_function["params"]) == 2
-
-    def test_extract_classes(self, js_extractor):
-        """Test extracting classes."""
-        content = """
-        class SimpleClass {
-            constructor() {
-                this.value = 0;
-            }
-
-            method() {
-                return this.value;
-            }
-        }
-
-        export class ExportedClass extends BaseClass {
-            static staticMethod() {
-                return 'static';
-            }
-
-            instanceMethod() {
-                return 'instance';
-            }
-        }
-        """
-
+    @pytest.mark.parametrize(
+        "extractor_method,content,item_type,expected_names",
+        [
+            (
+                "_extract_functions",
+                _FUNCTIONS_SOURCE,
+                "function",
+                {"simpleFunction", "asyncFunction", "exportedFunction"},
+            ),
+            (
+                "_extract_classes",
+                _CLASSES_SOURCE,
+                "class",
+                {"SimpleClass", "ExportedClass"},
+            ),
+            (
+                # Only function components are recognized, not arrow or class ones
+                "_extract_react_components",
+                _COMPONENTS_SOURCE,
+                "component",
+                {"FunctionComponent"},
+            ),
+        ],
+    )
+    def test_extract_items(
+        self, js_extractor, extractor_method, content, item_type, expected_names
+    ):
+        """Test extracting functions, classes and React components by name."""
         jsdocs = {}  # Empty JSDoc dictionary for this test
-        classes = js_extractor._extract_classes(content, jsdocs)
-
-        # The implementation might return class objects and method objects separately,
-        # or it might nest methods within classes. Check both possibilities.
-        class_objects = [c for c in classes if c.get("type", "") == "class"]
-
-        # If classes include methods internally
-        if len(class_objects) > 0 and "methods" in class_objects[0]:
-            assert len(class_objects) == 2  # SimpleClass and ExportedClass
-
-            # Check first class
-            simple_class = next(c for c in class_objects if c["name"] == "SimpleClass")
-            assert simple_class["name"] == "SimpleClass"
-            assert len(simple_class["methods"]) >= 1
-
-            # Check second class with inheritance
-            exported_class = next(
-                c for c in class_objects if c["name"] == "ExportedClass"
-            )
-            assert exported_class["name"] == "ExportedClass"
-            assert exported_class.get("extends") == "BaseClass"
-        else:
-            # If classes and methods are returned separately
-            all_classes = [
-                c for c in classes if "class_name" in c or c.get("type", "") == "class"
-            ]
-            assert (
-                len(all_classes) >= 2
-            )  # At least SimpleClass and ExportedClass objects
-
-            # Verify we have both class names
-            class_names = [c.get("name", c.get("class_name", "")) for c in all_classes]
-            assert "SimpleClass" in class_names
-            assert "ExportedClass" in class_names
-
-            # Check for inheritance
-            exported_class_objects = [
-                c for c in all_classes if "ExportedClass" in str(c)
-            ]
-            assert any("BaseClass" in str(c) for c in exported_class_objects)
+        items = getattr(js_extractor, extractor_method)(content, jsdocs)
 
-    def test_extract_react_components(self, js_extractor):
-        """Test extracting React components."""
-        content = """
-        function FunctionComponent(props) {
-            return <div>{props.text}</div>;
-        }
+        names = {item["name"] for item in items if item.get("type") == item_type}
+        assert names == expected_names
 
-        const ArrowComponent = ({ text }) => (
-            <span>{text}</span>
-        );
+    def test_extract_function_params(self, js_extractor):
+        """Test that extracted functions carry their parameters."""
+        functions = js_extractor._extract_functions(_FUNCTIONS_SOURCE, {})
+        functions_by_name = {f["name"]: f for f in functions}
 
-        class ClassComponent extends React.Component {
-            render() {
-                return (
-                    <div>
-                        <h1>{this.props.title}</h1>
-                        <p>{this.props.content}</p>
-                    </div>
-                );
-            }
-        }
-        """
-
-        jsdocs = {}  # Empty JSDoc dictionary for this test
-        components = js_extractor._extract_react_components(content, jsdocs)
+        assert len(functions_by_name["asyncFunction"]["params"]) == 1
+        assert len(functions_by_name["exportedFunction"]["params"]) == 2
 
-        # The implementation might only extract function components,
-        # not class components or arrow functions
-        assert len(components) >= 1  # At least one component should be found
-
-        # Check that at least one has the expected type
-        assert any(
-            c.get("type") == "component" or c.get("is_react_component")
-            for c in components
-        )
+    def test_extract_class_inheritance(self, js_extractor):
+        """Test that extracted classes record their base class and methods."""
+        classes = js_extractor._extract_classes(_CLASSES_SOURCE, {})
+        classes_by_name = {c["name"]: c for c in classes if c.get("type") == "class"}
 
-        # Check that at least one component has a name
-        component_names = [c.get("name", "") for c in components]
-        assert any(
-            name in ["FunctionComponent", "ArrowComponent", "ClassComponent"]
-            for name in component_names
-        )
+        assert classes_by_name["ExportedClass"].get("extends") == "BaseClass"
+        assert any(c.get("class_name") == "SimpleClass" for c in classes)
 
     def test_extract_jsx_elements(self, js_extractor):
         """Test extracting JSX elements."""
@@ -497,11 +466,7 @@ export default SampleComponent;
         """Test getting supported file extensions."""
         extensions = js_extractor.get_supported_extensions()
 
-        assert isinstance(extensions, set)
-        assert ".js" in extensions
-        assert ".jsx" in extensions
-        assert ".ts" in extensions
-        assert ".tsx" in extensions
+        assert {".js", ".jsx", ".ts", ".tsx"}.issubset(extensions)
 
     def test_file_error_handling(self, js_extractor, tmp_path):
         """Test handling errors when file doesn't exist or has invalid content."""
@@ -511,10 +476,67 @@ export default SampleComponent;
         assert results == []
 
         # Test with invalid JavaScript syntax
-        invalid_file = str(tmp_path / "invalid.js")
-        with open(invalid_file, "w") as f:
-            f.write("this is not valid JavaScript { syntax error")
+        invalid_file = tmp_path / "invalid.js"
+        invalid_file.write_bytes(b"this is not valid JavaScript { syntax error")
 
         # Should not raise an exception, but return empty list
-        results = js_extractor.extract_from_file(invalid_file)
+        results = js_extractor.extract_from_file(str(invalid_file))
         assert isinstance(results, list)
+
+
+@pytest.fixture
+def fake_re2(monkeypatch):
+    """Reload the extractor module with a fake RE2 that records its patterns."""
+    module = types.ModuleType("re2")
+    module.error = re.error
+    module.patterns = []
+
+    def compile(pattern):
+        # RE2 takes no flags argument, so flags must arrive inline
+        module.patterns.append(pattern)
+        return re.compile(pattern)
+
+    module.compile = compile
+    monkeypatch.setitem(sys.modules, "re2", module)
+    try:
+        yield importlib.reload(javascript_extractor)
+    finally:
+        monkeypatch.delitem(sys.modules, "re2")
+        importlib.reload(javascript_extractor)
+
+
+def test_compile_with_re2(fake_re2, worker_tmp_dir):
+    """Test that the RE2 branch compiles every pattern and matches the sample."""
+    assert fake_re2._FUNCTION_RE.pattern.startswith("(?m)")
+    for pattern in (fake_re2._FUNCTION_RE, fake_re2._CLASS_RE, fake_re2._JSDOC_RE):
+        assert pattern.pattern in fake_re2.re2.patterns
+
+    js_file = worker_tmp_dir / "sample_re2.js"
+    js_file.write_bytes(_JS_SAMPLE_BYTES)
+    results = fake_re2.JavaScriptExtractor().extract_from_file(str(js_file))
+
+    by_name = {item["name"]: item for item in results}
+    assert by_name["SampleClass"]["type"] == "class"
+    assert by_name["arrowFunction"]["type"] == "function"
+    sample_function = by_name["sampleFunction"]
+    assert [p["name"] for p in sample_function["params"]] == ["param1", "param2"]
+    assert "sample function" in sample_function["docstring"].lower()
+
+
+@pytest.mark.parametrize(
+    "flags, expected",
+    [
+        (0, "a.b"),
+        (re.MULTILINE, "(?m)a.b"),
+        (re.IGNORECASE | re.DOTALL, "(?is)a.b"),
+    ],
+)
+def test_compile_inline_flags(flags, expected):
+    """Test that supported flags are applied as an inline group."""
+    assert javascript_extractor._compile("a.b", flags).pattern == expected
+
+
+def test_compile_rejects_unsupported_flags():
+    """Test that flags without an inline translation are refused."""
+    with pytest.raises(ValueError):
+        javascript_extractor._compile("a b", re.VERBOSE)
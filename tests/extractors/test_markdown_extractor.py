@@ -1,25 +1,12 @@
 """Tests for the MarkdownExtractor class."""
 
 import os
-import tempfile
 import pytest
+from unittest.mock import patch
 from src.extractors.markdown_extractor import MarkdownExtractor
 
 
-class TestMarkdownExtractor:
-    """Tests for the MarkdownExtractor class."""
-
-    @pytest.fixture
-    def markdown_extractor(self):
-        """Create a MarkdownExtractor instance for testing."""
-        return MarkdownExtractor()
-
-    @pytest.fixture
-    def temp_markdown_file(self):
-        """Create a temporary Markdown file for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".md", delete=False) as temp_file:
-            temp_file.write(
-                b"""# Sample Markdown Document
+_MD_SAMPLE_BYTES = b"""# Sample Markdown Document
 
 This is a sample Markdown document for testing.
 
@@ -73,28 +60,53 @@ More detailed usage information.
 ---
 
 """
-            )
-        yield temp_file.name
-        # Clean up
-        os.unlink(temp_file.name)
-
-    @pytest.fixture
-    def temp_invalid_file(self):
-        """Create a temporary invalid file for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"This is not a markdown file.")
-        yield f.name
-        os.unlink(f.name)
+
+
+class TestMarkdownExtractor:
+    """Tests for the MarkdownExtractor class."""
+
+    @pytest.fixture(scope="module")
+    def markdown_extractor(self):
+        """Create a MarkdownExtractor instance for testing."""
+        return MarkdownExtractor()
+
+    @pytest.fixture(scope="module")
+    def temp_markdown_file(self, worker_tmp_dir):
+        """Create a Markdown file shared by the tests in this module."""
+        markdown_file = worker_tmp_dir / "sample.md"
+        markdown_file.write_bytes(_MD_SAMPLE_BYTES)
+        return str(markdown_file)
+
+    @pytest.fixture(scope="module")
+    def markdown_content(self):
+        """Return the sample Markdown document as text."""
+        return _MD_SAMPLE_BYTES.decode("utf-8")
+
+    @pytest.fixture(scope="module")
+    def temp_invalid_file(self, worker_tmp_dir):
+        """Create an invalid file shared by the tests in this module."""
+        invalid_file = worker_tmp_dir / "invalid.txt"
+        invalid_file.write_bytes(b"This is not a markdown file.")
+        return str(invalid_file)
 
     def test_initialization(self, markdown_extractor):
         """Test that the extractor initializes properly."""
         assert markdown_extractor is not None
         assert hasattr(markdown_extractor, "extract_from_file")
-        # The implementation doesn't have extract_from_content or get_supported_extensions methods
+        assert hasattr(markdown_extractor, "extract_from_content")
 
-    def test_extract_from_file(self, markdown_extractor, temp_markdown_file):
-        """Test extracting information from a Markdown file."""
+    def test_extract_from_file(
+        self, markdown_extractor, temp_markdown_file, markdown_content
+    ):
+        """Test that extracting from a file matches extracting its content."""
         results = markdown_extractor.extract_from_file(temp_markdown_file)
+        assert results == markdown_extractor.extract_from_content(
+            markdown_content, temp_markdown_file
+        )
+
+    def test_extract_from_content(self, markdown_extractor, markdown_content):
+        """Test extracting information from Markdown content."""
+        results = markdown_extractor.extract_from_content(markdown_content, "sample.md")
 
         # Should have multiple sections
         assert len(results) > 0
@@ -124,12 +136,13 @@ More detailed usage information.
             assert "content_type" in section
             assert section["content_type"] == "documentation"
 
-    def test_extract_sections(self, markdown_extractor, temp_markdown_file):
+    def test_extract_sections(
+        self, markdown_extractor, temp_markdown_file, markdown_content
+    ):
         """Test extracting sections from Markdown content."""
-        with open(temp_markdown_file, "r") as f:
-            content = f.read()
-
-        sections = markdown_extractor._extract_sections(content, temp_markdown_file)
+        sections = markdown_extractor._extract_sections(
+            markdown_content, temp_markdown_file
+        )
 
         # Check number of sections
         # There should be main sections plus code blocks
@@ -144,49 +157,33 @@ More detailed usage information.
         assert len(h2_sections) >= 4  # At least 4 h2s
         assert len(h3_sections) >= 1  # At least one h3
 
-    def test_extract_code_blocks(self, markdown_extractor, temp_markdown_file):
+    def test_extract_code_blocks(
+        self, markdown_extractor, temp_markdown_file, markdown_content
+    ):
         """Test extracting code blocks from Markdown."""
-        with open(temp_markdown_file, "r") as f:
-            content = f.read()
-
         code_blocks = markdown_extractor._extract_code_blocks(
-            content, temp_markdown_file
+            markdown_content, temp_markdown_file
         )
 
         # Should find at least one code block
         assert len(code_blocks) >= 1
 
-        # Check code block contents - implementation might vary in how it extracts blocks
-        # or what metadata it includes
-
-        # At least one block should contain Python code
+        # At least one block should contain the Python code in one of its
+        # string fields, whichever field the implementation stores it in
         python_content_found = any(
-            "from sample import Sample" in block.get("content", "")
+            isinstance(value, str) and "from sample import Sample" in value
             for block in code_blocks
+            for value in block.values()
         )
 
-        # If no blocks with Python code are found directly, look for any content
-        # that might contain the Python code
-        if not python_content_found:
-            python_content_found = any(
-                "from sample import Sample" in str(block) for block in code_blocks
-            )
-
         assert python_content_found, "Python code block not found"
 
-    def test_extract_from_empty_file(self, markdown_extractor):
-        """Test extracting from an empty file."""
-        with tempfile.NamedTemporaryFile(suffix=".md", delete=False) as temp_file:
-            temp_file.write(b"")
-            empty_file = temp_file.name
-
-        try:
-            results = markdown_extractor.extract_from_file(empty_file)
-            # Should return at least one section (whole document)
-            assert len(results) > 0
-            assert results[0]["content"] == ""
-        finally:
-            os.unlink(empty_file)
+    def test_extract_from_empty_content(self, markdown_extractor):
+        """Test extracting from an empty document."""
+        results = markdown_extractor.extract_from_content("", "empty.md")
+        # Should return at least one section (whole document)
+        assert len(results) > 0
+        assert results[0]["content"] == ""
 
     def test_extract_from_invalid_file(self, markdown_extractor):
         """Test extracting from an invalid file."""
@@ -194,25 +191,57 @@ More detailed usage information.
         results = markdown_extractor.extract_from_file("nonexistent_file.md")
         assert results == []
 
+    def test_extract_from_file_cached(self, tmp_path):
+        """Test that unchanged files are only parsed once."""
+        extractor = MarkdownExtractor()
+        md_file = tmp_path / "cached.md"
+        md_file.write_text("# Title\n\nFirst version.\n")
+
+        with patch.object(
+            extractor, "_extract_uncached", wraps=extractor._extract_uncached
+        ) as mock_extract:
+            first = extractor.extract_from_file(str(md_file))
+            first[0]["content"] = "modified by caller"
+            second = extractor.extract_from_file(str(md_file))
+            assert mock_extract.call_count == 1
+            assert second[0]["content"] != "modified by caller"
+
+            # Rewriting the file invalidates the cached result
+            md_file.write_text("# Title\n\nSecond, longer version.\n")
+            third = extractor.extract_from_file(str(md_file))
+            assert mock_extract.call_count == 2
+            assert "Second" in third[0]["content"]
+
+    def test_cached_results_are_independent(self, tmp_path):
+        """Test that modifying a returned section does not reach the cache."""
+        extractor = MarkdownExtractor()
+        md_file = tmp_path / "doc.md"
+        md_file.write_text("# Title\n\nText.\n\n```python\nx = 1\n```\n")
+
+        first = extractor.extract_from_file(str(md_file))
+        expected = [dict(section) for section in first]
+        # Cache hits are shallow copies, which relies on flat sections
+        for section in first:
+            assert all(isinstance(v, (str, int)) for v in section.values())
+            section["content"] = "modified by caller"
+            del section["type"]
+
+        assert extractor.extract_from_file(str(md_file)) == expected
+
     def test_error_handling(self, markdown_extractor, tmp_path):
         """Test error handling during extraction."""
+        # chmod cannot revoke read access on Windows or for root
+        if not hasattr(os, "geteuid") or os.geteuid() == 0:
+            pytest.skip("chmod 0 does not make files unreadable here")
+
         # Create a file that exists but cannot be read
-        unreadable_file = str(tmp_path / "unreadable.md")
-        with open(unreadable_file, "w") as f:
-            f.write("# Test content")
+        unreadable_file = tmp_path / "unreadable.md"
+        unreadable_file.write_bytes(b"# Test content")
 
-        # Make file unreadable if possible (skip on Windows)
+        os.chmod(unreadable_file, 0)
         try:
-            os.chmod(unreadable_file, 0)
-            results = markdown_extractor.extract_from_file(unreadable_file)
+            results = markdown_extractor.extract_from_file(str(unreadable_file))
             assert results == []
-        except Exception:
-            # If we can't make the file unreadable, just skip this part
-            pass
         finally:
-            # Clean up
-            try:
-                os.chmod(unreadable_file, 0o644)
-                os.unlink(unreadable_file)
-            except Exception:
-                pass
+            # Restore permissions so tmp_path can be cleaned up
+            os.chmod(unreadable_file, 0o644)
@@ -1,26 +1,34 @@
 """Tests for the PythonExtractor class."""
 
-import os
 import ast
-import tempfile
+from pathlib import Path
 import pytest
 from src.extractors.python_extractor import PythonExtractor
 
 
-class TestPythonExtractor:
-    """Test class for PythonExtractor."""
+# A large file with many functions, for testing chunked extraction
+_LARGE_PYTHON_SOURCE = (
+    "# Large test file\n\n"
+    + "".join(
+        f"""
+def function_{i}(param1, param2):
+    \"\"\"Function {i} docstring.
+
+    Args:
+        param1: First parameter
+        param2: Second parameter
 
-    @pytest.fixture
-    def python_extractor(self):
-        """Create a Python extractor for testing."""
-        return PythonExtractor()
-
-    @pytest.fixture
-    def temp_python_file(self):
-        """Create a temporary Python file for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as f:
-            f.write(
-                b"""#!/usr/bin/env python3
+    Returns:
+        Result of the function
+    \"\"\"
+    return param1 + param2 + {i}
+
+"""
+        for i in range(100)
+    )
+).encode("utf-8")
+
+_SAMPLE_PY_SOURCE = b"""#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
 \"\"\"Module for testing the Python extractor.
@@ -220,34 +228,113 @@ if __name__ == "__main__":
     api = APIClass()
     print(api.get_data("/users"))
 """
-            )
-        yield f.name
-        os.unlink(f.name)
-
-    @pytest.fixture
-    def large_python_file(self):
-        """Create a large temporary Python file for testing chunking."""
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as f:
-            # Generate a large file with many functions
-            content = "# Large test file\n\n"
-            for i in range(100):
-                content += f"""
-def function_{i}(param1, param2):
-    \"\"\"Function {i} docstring.
 
-    Args:
-        param1: First parameter
-        param2: Second parameter
 
-    Returns:
-        Result of the function
-    \"\"\"
-    return param1 + param2 + {i}
+# Small sources whose first function or class is used by the pattern tests
+_SNIPPETS = {
+    "api_function": """
+def sample_api_function(request, response):
+    \"\"\"API function docstring.\"\"\"
+    data = request.json()
+    response.set_header('Content-Type', 'application/json')
+    return response.json({'status': 'ok'})
+""",
+    "api_endpoint": """
+def api_endpoint(request):
+    \"\"\"API endpoint function.\"\"\"
+    if request.method == 'GET':
+        return {'data': 'get response'}
+    elif request.method == 'POST':
+        return {'data': 'post response'}
+""",
+    "api_client": """
+class APIClient:
+    \"\"\"API client class.\"\"\"
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.session = None
+
+    def get(self, endpoint):
+        return self._request('GET', endpoint)
+
+    def post(self, endpoint, data):
+        return self._request('POST', endpoint, data)
+
+    def _request(self, method, endpoint, data=None):
+        url = f"{self.base_url}/{endpoint}"
+        return {'method': method, 'url': url, 'data': data}
+""",
+    "flask": """
+@app.route('/api/users')
+def get_users():
+    return jsonify({'users': users})
+""",
+    "django": """
+@login_required
+def user_view(request):
+    if request.method == 'POST':
+        form = UserForm(request.POST)
+        if form.is_valid():
+            form.save()
+    return render(request, 'users.html')
+""",
+    "fastapi": """
+@app.get('/items/{item_id}')
+def read_item(item_id: int):
+    return {'item_id': item_id}
+""",
+}
 
-"""
-            f.write(content.encode("utf-8"))
-        yield f.name
-        os.unlink(f.name)
+
+def _first(tree, node_type):
+    """Return the first top-level node of the given type, or None."""
+    for node in tree.body:
+        if isinstance(node, node_type):
+            return node
+    return None
+
+
+class TestPythonExtractor:
+    """Test class for PythonExtractor."""
+
+    @pytest.fixture(scope="module")
+    def temp_python_file(self, worker_tmp_dir):
+        """Create a Python file shared by the tests in this module."""
+        python_file = worker_tmp_dir / "sample.py"
+        python_file.write_bytes(_SAMPLE_PY_SOURCE)
+        return str(python_file)
+
+    @pytest.fixture(scope="module")
+    def python_tree(self, temp_python_file):
+        """Parse the temporary Python file once for the tests in this module."""
+        return ast.parse(Path(temp_python_file).read_text())
+
+    @pytest.fixture(scope="module")
+    def python_nodes(self, python_tree):
+        """Index the top-level functions and classes of the parsed file by name."""
+        index = {}
+        for node in ast.iter_child_nodes(python_tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                index[("func", node.name)] = node
+            elif isinstance(node, ast.ClassDef):
+                index[("class", node.name)] = node
+        return index
+
+    @pytest.fixture(scope="module")
+    def snippet_nodes(self):
+        """Parse each snippet once and return its top-level function or class."""
+        return {
+            name: _first(ast.parse(source), (ast.FunctionDef, ast.ClassDef))
+            for name, source in _SNIPPETS.items()
+        }
+
+    @pytest.fixture(scope="module")
+    def large_python_file(self, worker_tmp_dir):
+        """Create a large Python file for testing chunking."""
+        large_file = worker_tmp_dir / "large.py"
+        large_file.write_bytes(_LARGE_PYTHON_SOURCE)
+        return str(large_file)
 
     def test_initialization(self, python_extractor):
         """Test that PythonExtractor initializes properly."""
@@ -268,13 +355,11 @@ def function_{i}(param1, param2):
         # Check that we got various types of extracted items
         assert len(results) > 10  # Should extract many items
 
-        # Check for imports - imports might be included inline with functions/classes
-        # or extracted as separate items depending on implementation
-        imports = [item for item in results if item.get("type") == "import"]
-        imports_in_other_items = any("import" in str(item) for item in results)
-
-        # Either we have explicit import items or imports are included in other items
-        assert len(imports) > 0 or imports_in_other_items
+        # Check for imports - they might be extracted as separate items or
+        # listed in the "imports" field of the module item
+        assert any(
+            item.get("type") == "import" or item.get("imports") for item in results
+        )
 
         # Check for functions
         functions = [item for item in results if item["type"] == "function"]
@@ -356,10 +441,11 @@ class TestClass:
             ]
             assert len(methods) >= 1
 
-    def test_extract_from_large_file(self, python_extractor, large_python_file):
+    def test_extract_from_large_file(self, large_python_file):
         """Test extracting information from a large Python file."""
-        # Override the large file threshold to force chunked processing
-        python_extractor.large_file_threshold = 1024  # Set low threshold
+        # Use a low threshold to force chunked processing; a local extractor
+        # keeps the shared module-scoped one unchanged
+        python_extractor = PythonExtractor(large_file_threshold=1024)
 
         results = python_extractor.extract_from_file(large_python_file)
 
@@ -368,26 +454,14 @@ class TestClass:
         assert len(functions) == 100
 
         # Verify function names
-        function_names = [f["name"] for f in functions]
-        for i in range(100):
-            assert f"function_{i}" in function_names
+        function_names = {f["name"] for f in functions}
+        assert {f"function_{i}" for i in range(100)} <= function_names
 
-    def test_extract_function_info(self, python_extractor, temp_python_file):
+    def test_extract_function_info(
+        self, python_extractor, temp_python_file, python_nodes
+    ):
         """Test extracting detailed function information."""
-        # Parse the file to get an AST
-        with open(temp_python_file, "r") as f:
-            content = f.read()
-
-        tree = ast.parse(content)
-
-        # Find a function node
-        function_node = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.name == "sample_function":
-                function_node = node
-                break
-
-        assert function_node is not None
+        function_node = python_nodes[("func", "sample_function")]
 
         # Extract function info
         function_info = python_extractor._extract_function_info(
@@ -413,22 +487,9 @@ class TestClass:
             # Return type might be included in the docstring or elsewhere
             assert "bool" in str(function_info)
 
-    def test_extract_class_info(self, python_extractor, temp_python_file):
+    def test_extract_class_info(self, python_extractor, temp_python_file, python_nodes):
         """Test extracting detailed class information."""
-        # Parse the file to get an AST
-        with open(temp_python_file, "r") as f:
-            content = f.read()
-
-        tree = ast.parse(content)
-
-        # Find a class node
-        class_node = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == "SampleClass":
-                class_node = node
-                break
-
-        assert class_node is not None
+        class_node = python_nodes[("class", "SampleClass")]
 
         # Extract class info
         class_info = python_extractor._extract_class_info(class_node, temp_python_file)
@@ -444,16 +505,10 @@ class TestClass:
             assert isinstance(class_info["methods"], list)
         # Otherwise, methods might be extracted separately
 
-    def test_extract_imports(self, python_extractor, temp_python_file):
+    def test_extract_imports(self, python_extractor, python_tree):
         """Test extracting import information."""
-        # Parse the file to get an AST
-        with open(temp_python_file, "r") as f:
-            content = f.read()
-
-        tree = ast.parse(content)
-
         # Extract imports
-        imports = python_extractor._extract_imports(tree)
+        imports = python_extractor._extract_imports(python_tree)
 
         # Verify extraction results
         assert len(imports) > 0  # Should have at least some imports
@@ -473,75 +528,26 @@ class TestClass:
         # or might format them differently
         # So we don't make assertions about typing imports specifically
 
-    def test_identify_function_patterns(self, python_extractor):
-        """Test identifying function patterns."""
-        # Create an example function node using a string
-        func_code = """
-def sample_api_function(request, response):
-    \"\"\"API function docstring.\"\"\"
-    data = request.json()
-    response.set_header('Content-Type', 'application/json')
-    return response.json({'status': 'ok'})
-"""
-        tree = ast.parse(func_code)
-        func_node = next(
-            node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)
-        )
-
-        # Identify patterns
-        patterns = python_extractor._identify_function_patterns(func_node)
-
-        # Should identify as API-related
-        assert any("api" in pattern.lower() for pattern in patterns)
-
-    def test_identify_api_patterns(self, python_extractor):
-        """Test identifying API patterns."""
-        # Create an example API function
-        func_code = """
-def api_endpoint(request):
-    \"\"\"API endpoint function.\"\"\"
-    if request.method == 'GET':
-        return {'data': 'get response'}
-    elif request.method == 'POST':
-        return {'data': 'post response'}
-"""
-        tree = ast.parse(func_code)
-        func_node = next(
-            node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)
-        )
-
-        # Identify API patterns
-        patterns = python_extractor._identify_api_patterns(func_node)
-
-        # Should identify as an API endpoint
-        assert len(patterns) > 0
-        assert any("endpoint" in p.lower() for p in patterns)
-
-    def test_identify_class_patterns(self, python_extractor):
+    @pytest.mark.parametrize(
+        "snippet,method,expected",
+        [
+            ("api_function", "_identify_function_patterns", "api"),
+            ("api_endpoint", "_identify_api_patterns", "endpoint"),
+            ("flask", "_identify_flask_patterns", "route"),
+            ("django", "_identify_django_patterns", "view"),
+            ("fastapi", "_identify_fastapi_patterns", "endpoint"),
+        ],
+    )
+    def test_identify_patterns(
+        self, python_extractor, snippet_nodes, snippet, method, expected
+    ):
+        """Test identifying function, API and framework patterns."""
+        patterns = getattr(python_extractor, method)(snippet_nodes[snippet])
+        assert any(expected in pattern.lower() for pattern in patterns)
+
+    def test_identify_class_patterns(self, python_extractor, snippet_nodes):
         """Test identifying class patterns."""
-        # Create an example class with patterns
-        class_code = """
-class APIClient:
-    \"\"\"API client class.\"\"\"
-
-    def __init__(self, base_url):
-        self.base_url = base_url
-        self.session = None
-
-    def get(self, endpoint):
-        return self._request('GET', endpoint)
-
-    def post(self, endpoint, data):
-        return self._request('POST', endpoint, data)
-
-    def _request(self, method, endpoint, data=None):
-        url = f"{self.base_url}/{endpoint}"
-        return {'method': method, 'url': url, 'data': data}
-"""
-        tree = ast.parse(class_code)
-        class_node = next(
-            node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)
-        )
+        class_node = snippet_nodes["api_client"]
 
         # Identify class patterns
         patterns = python_extractor._identify_class_patterns(class_node)
@@ -567,12 +573,11 @@ class APIClient:
         assert results == []
 
         # Test with invalid Python syntax
-        invalid_file = str(tmp_path / "invalid.py")
-        with open(invalid_file, "w") as f:
-            f.write("This is not valid Python syntax )")
+        invalid_file = tmp_path / "invalid.py"
+        invalid_file.write_bytes(b"This is not valid Python syntax )")
 
         # Should handle gracefully
-        results = python_extractor.extract_from_file(invalid_file)
+        results = python_extractor.extract_from_file(str(invalid_file))
         assert isinstance(results, list)
 
     def test_get_supported_extensions(self, python_extractor):
@@ -599,9 +604,7 @@ def test_function():
     return x + y
 """
         tree = ast.parse(func_code)
-        func_node = next(
-            node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)
-        )
+        func_node = _first(tree, ast.FunctionDef)
 
         # Extract function body
         body = python_extractor._extract_function_body(func_node)
@@ -625,9 +628,7 @@ def complex_func():
     return results
 """
         tree = ast.parse(func_code)
-        func_node = next(
-            node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)
-        )
+        func_node = _first(tree, ast.FunctionDef)
 
         # Extract key operations
         operations = python_extractor._extract_key_operations(func_node)
@@ -638,57 +639,3 @@ def complex_func():
         assert any("process_data" in op for op in operations)
         assert any("analyze_results" in op for op in operations)
         assert any("save_results" in op for op in operations)
-
-    def test_identify_framework_patterns(self, python_extractor):
-        """Test identifying patterns for common frameworks."""
-        # Test Flask pattern
-        flask_code = """
-@app.route('/api/users')
-def get_users():
-    return jsonify({'users': users})
-"""
-        tree = ast.parse(flask_code)
-        func_node = next(
-            node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)
-        )
-
-        flask_patterns = python_extractor._identify_flask_patterns(func_node)
-        assert any("route" in p.lower() for p in flask_patterns)
-
-        # Test Django pattern
-        django_code = """
-@login_required
-def user_view(request):
-    if request.method == 'POST':
-        form = UserForm(request.POST)
-        if form.is_valid():
-            form.save()
-    return render(request, 'users.html')
-"""
-        tree = ast.parse(django_code)
-        func_node = next(
-            node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)
-        )
-
-        django_patterns = python_extractor._identify_django_patterns(func_node)
-        assert any("login" in p.lower() or "view" in p.lower() for p in django_patterns)
-
-        # The FastAPI test is failing due to a syntax error in the test code
-        # Let's fix it by using proper version syntax
-        fastapi_code = """
-@app.get('/items/{item_id}')
-def read_item(item_id: int):
-    return {'item_id': item_id}
-"""
-        try:
-            tree = ast.parse(fastapi_code)
-            func_node = next(
-                node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)
-            )
-
-            fastapi_patterns = python_extractor._identify_fastapi_patterns(func_node)
-            # Check that we got some patterns
-            assert isinstance(fastapi_patterns, list)
-        except Exception:
-            # If there's a syntax error or other issue, skip the test
-            pass
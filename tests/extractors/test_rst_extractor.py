@@ -1,25 +1,10 @@
 """Tests for the RSTExtractor class."""
 
 import os
-import tempfile
 import pytest
-from src.extractors.rst_extractor import RSTExtractor
 
 
-class TestRSTExtractor:
-    """Test the RSTExtractor class."""
-
-    @pytest.fixture
-    def rst_extractor(self):
-        """Create an RSTExtractor instance for testing."""
-        return RSTExtractor()
-
-    @pytest.fixture
-    def temp_rst_file(self):
-        """Create a temporary RST file for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".rst", delete=False) as temp_file:
-            temp_file.write(
-                b"""Sample Document
+_SAMPLE_RST_SOURCE = b"""Sample Document
 =============
 
 This is a sample reStructuredText document.
@@ -54,10 +39,27 @@ For more details, please see the documentation.
 .. note::
     This is a note.
 """
-            )
-        yield temp_file.name
-        # Clean up
-        os.unlink(temp_file.name)
+
+
+class TestRSTExtractor:
+    """Test the RSTExtractor class."""
+
+    @pytest.fixture(scope="module")
+    def temp_rst_file(self, worker_tmp_dir):
+        """Create an RST file shared by the tests in this module."""
+        rst_file = worker_tmp_dir / "sample.rst"
+        rst_file.write_bytes(_SAMPLE_RST_SOURCE)
+        return str(rst_file)
+
+    @pytest.fixture(scope="module")
+    def rst_results(self, rst_extractor, temp_rst_file):
+        """Extract the sample RST file once for the tests in this module."""
+        return tuple(rst_extractor.extract_from_file(temp_rst_file))
+
+    @pytest.fixture(scope="module")
+    def rst_sections_by_title(self, rst_results):
+        """Index the extracted sections by their title."""
+        return {section["title"]: section for section in rst_results}
 
     def test_initialization(self, rst_extractor):
         """Test that RSTExtractor initializes properly."""
@@ -65,79 +67,56 @@ For more details, please see the documentation.
         assert hasattr(rst_extractor, "extract_from_file")
         # RSTExtractor doesn't implement get_supported_extensions
 
-    def test_extract_from_rst_file(self, rst_extractor, temp_rst_file):
+    def test_extract_from_rst_file(self, rst_results, temp_rst_file):
         """Test extracting from an RST file."""
-        results = rst_extractor.extract_from_file(temp_rst_file)
-
         # Should have extracted several sections
-        assert len(results) > 0
+        assert len(rst_results) > 0
 
-        # Check the default section
-        main_section = next((s for s in results if s["level"] == 0), None)
-        assert main_section is not None
+        # The default section covering the whole document comes first
+        main_section = rst_results[0]
+        assert main_section["level"] == 0
         assert main_section["type"] == "section"
         assert os.path.basename(temp_rst_file) in main_section["title"]
         assert "Sample Document" in main_section["content"]
 
-    def test_extract_hierarchical_structure(self, rst_extractor, temp_rst_file):
+    def test_extract_hierarchical_structure(
+        self, rst_sections_by_title, temp_rst_file
+    ):
         """Test that sections maintain their hierarchical structure."""
-        results = rst_extractor.extract_from_file(temp_rst_file)
-
-        # Find the main heading and subheadings
-        main_heading = next(
-            (s for s in results if "Sample Document" in s["content"]), None
-        )
-        assert main_heading is not None
+        # The full document is stored as a level 0 section named after the file
+        main_heading = rst_sections_by_title[os.path.basename(temp_rst_file)]
         # Note: actual implementation uses level 0 for the full document, not 1
         assert main_heading["level"] == 0
+        assert "Sample Document" in main_heading["content"]
 
-        # Find Installation section
-        installation = next(
-            (s for s in results if "Installation" in s["content"]), None
-        )
-        assert installation is not None
+        # Subheadings are nested below the document title
+        title = rst_sections_by_title["Sample Document"]
+        installation = rst_sections_by_title["Installation"]
+        assert 0 < title["level"] < installation["level"]
         # Check Installation section has proper content
         assert "pip install package" in installation["content"]
 
-    def test_extract_code_blocks(self, rst_extractor, temp_rst_file):
+    def test_extract_code_blocks(self, rst_sections_by_title):
         """Test extracting code blocks from RST content."""
-        results = rst_extractor.extract_from_file(temp_rst_file)
-
-        # Find sections that should have code blocks
-        installation = next(
-            (s for s in results if "Installation" in s["content"]), None
-        )
-        assert installation is not None
-
-        # Section doesn't directly contain code_blocks as a field in the implementation
-        # Instead, the _extract_code_blocks method is used internally
         # Check if the code block content is in the section content
+        installation = rst_sections_by_title["Installation"]
         assert "pip install package" in installation["content"]
+        assert installation["code_blocks"][0]["language"] == "bash"
 
-        # Find usage section which has Python code
-        usage = next((s for s in results if "Usage" in s["content"]), None)
-        assert usage is not None
+        # Usage section has Python code
+        usage = rst_sections_by_title["Usage"]
         assert "import package" in usage["content"]
+        assert usage["code_blocks"][0]["language"] == "python"
 
-    def test_extract_directives(self, rst_extractor, temp_rst_file):
+    def test_extract_directives(self, rst_sections_by_title):
         """Test extracting directives from RST content."""
-        results = rst_extractor.extract_from_file(temp_rst_file)
-
-        # Find the section with a note directive
-        section_with_note = next(
-            (s for s in results if "This is a note" in s["content"]), None
-        )
-        assert section_with_note is not None
+        # The note directive belongs to the last section
+        section_with_note = rst_sections_by_title["More Information"]
+        assert "This is a note" in section_with_note["content"]
 
-    def test_extract_bullet_points(self, rst_extractor, temp_rst_file):
+    def test_extract_bullet_points(self, rst_sections_by_title):
         """Test extracting bullet points from RST content."""
-        results = rst_extractor.extract_from_file(temp_rst_file)
-
-        # Find the section with bullet points
-        section_with_bullets = next(
-            (s for s in results if "Bullet point" in s["content"]), None
-        )
-        assert section_with_bullets is not None
+        section_with_bullets = rst_sections_by_title["More Information"]
         assert "Bullet point 1" in section_with_bullets["content"]
         assert "Bullet point 2" in section_with_bullets["content"]
 
@@ -171,18 +150,25 @@ This is content.
         title2 = rst_extractor._find_title(content2)
         assert title2 == "Sample Title"
 
-    def test_is_header_marker(self, rst_extractor):
+    @pytest.mark.parametrize(
+        "marker,expected",
+        [
+            ("=====", True),
+            ("-----", True),
+            ("===-==", False),
+            ("not a marker", False),
+            ("", False),
+        ],
+    )
+    def test_is_header_marker(self, rst_extractor, marker, expected):
         """Test checking if a line is a header marker."""
-        assert rst_extractor._is_header_marker("=====")
-        assert rst_extractor._is_header_marker("-----")
-        assert not rst_extractor._is_header_marker("===-==")
-        assert not rst_extractor._is_header_marker("not a marker")
-        assert not rst_extractor._is_header_marker("")
+        assert rst_extractor._is_header_marker(marker) is expected
 
-    def test_get_header_level(self, rst_extractor):
+    @pytest.mark.parametrize("marker,expected", [("=", 3), ("-", 4)])
+    def test_get_header_level(self, rst_extractor, marker, expected):
         """Test getting header level from marker character."""
-        assert rst_extractor._get_header_level("=") == 3
-        assert rst_extractor._get_header_level("-") == 4
-        assert (
-            rst_extractor._get_header_level("~") >= 3
-        )  # Not in predefined list, should be a deep level
+        assert rst_extractor._get_header_level(marker) == expected
+
+    def test_get_header_level_unlisted_marker(self, rst_extractor):
+        """Test that markers outside the predefined list get a deep level."""
+        assert rst_extractor._get_header_level("~") >= 3
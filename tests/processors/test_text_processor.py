@@ -4,14 +4,15 @@ import pytest
 from src.processors.text_processor import TextProcessor
 
 
+@pytest.fixture(scope="module")
+def text_processor():
+    """Create a TextProcessor shared by the tests in this module."""
+    return TextProcessor(use_spacy=False)  # Use NLTK for consistent testing
+
+
 class TestTextProcessor:
     """Tests for the TextProcessor class."""
 
-    @pytest.fixture
-    def text_processor(self):
-        """Create a TextProcessor instance for testing."""
-        return TextProcessor(use_spacy=False)  # Use NLTK for consistent testing
-
     def test_initialization(self, text_processor):
         """Test that TextProcessor initializes properly."""
         assert isinstance(text_processor, TextProcessor)
@@ -54,6 +55,21 @@ class TestTextProcessor:
             or "configure" in processed["processed_text"]
         )
 
+    def test_process_chunks(self, text_processor):
+        """Test that batch processing matches processing chunks one by one."""
+        chunks = [
+            {"type": "function", "name": "f", "docstring": "Adds two numbers."},
+            {"type": "class", "name": "C", "docstring": ""},
+            {"type": "section", "title": "Usage", "content": "Call `f` twice."},
+            {"type": "unknown", "content": "Left untouched."},
+        ]
+
+        processed = text_processor.process_chunks(chunks)
+
+        assert processed == [text_processor.process_chunk(c) for c in chunks]
+        assert "processed_text" not in processed[3]
+        assert text_processor.process_chunks([]) == []
+
     def test_clean_text(self, text_processor):
         """Test the combined text cleaning process."""
         # Test with text that needs both code removal and whitespace normalization
@@ -0,0 +1,160 @@
+"""Tests for the ChunkColumns class."""
+
+import numpy as np
+import pytest
+from src.search.chunk_columns import ChunkColumns
+
+
+class TestChunkColumns:
+    """Test class for ChunkColumns."""
+
+    @pytest.fixture
+    def chunks(self):
+        """Create sample chunks for testing."""
+        return [
+            {
+                "type": "function",
+                "params": [
+                    {"name": "path", "type": "str"},
+                    {"name": "limit", "type": "Optional[int]"},
+                ],
+                "return_type": "Dict[str, Any]",
+                "content_type": "code",
+            },
+            {
+                "type": "method",
+                "parameters": [{"name": "self"}],
+                "returns": "None",
+                "content_type": "code",
+            },
+            {"type": "section", "content_type": "documentation"},
+            {"type": "function", "params": [], "return_type": None},
+        ]
+
+    def test_from_chunks(self, chunks):
+        """Test building the columnar layout from chunks."""
+        columns = ChunkColumns.from_chunks(chunks)
+
+        assert len(columns) == 4
+        assert list(columns.param_offsets) == [0, 2, 3, 3, 3]
+        assert columns.param_names_lower.decode() == ["path", "limit", "self"]
+        assert columns.param_types_lower.decode() == ["str", "optional[int]", ""]
+        assert columns.return_types_lower.decode() == ["dict[str, any]", "none", "", ""]
+
+    def test_extend(self, chunks):
+        """Test that extending keeps parameter offsets consistent."""
+        columns = ChunkColumns.from_chunks(chunks[:2])
+        columns.extend(chunks[2:])
+
+        expected = ChunkColumns.from_chunks(chunks)
+        assert list(columns.param_offsets) == list(expected.param_offsets)
+        assert columns.types.decode() == expected.types.decode()
+
+    def test_extend_columns(self, chunks):
+        """Test that appending columns matches extending with the chunks."""
+        columns = ChunkColumns.from_chunks(chunks[:2])
+        columns.extend_columns(ChunkColumns.from_chunks(chunks[2:]))
+        columns.extend_columns(ChunkColumns())
+
+        expected = ChunkColumns.from_chunks(chunks)
+        assert list(columns.param_offsets) == list(expected.param_offsets)
+        for name in ChunkColumns._ENCODED_FIELDS:
+            assert getattr(columns, name).decode() == getattr(expected, name).decode()
+
+    def test_match(self, chunks):
+        """Test evaluating type and signature filters."""
+        columns = ChunkColumns.from_chunks(chunks)
+        ids = np.arange(len(chunks))
+
+        assert list(columns.match(ids)) == [True, True, True, True]
+        assert list(columns.match(ids, type_filter="section")) == [
+            False,
+            False,
+            True,
+            False,
+        ]
+        assert list(columns.match(ids, param_type="int")) == [
+            True,
+            False,
+            False,
+            False,
+        ]
+        assert list(columns.match(ids, param_name="self")) == [
+            False,
+            True,
+            False,
+            False,
+        ]
+        assert list(columns.match(ids, return_type="none")) == [
+            False,
+            True,
+            False,
+            False,
+        ]
+
+        # Candidates may be given in any order and repeated
+        assert list(columns.match(np.array([1, 0, 0]), param_name="path")) == [
+            False,
+            True,
+            True,
+        ]
+
+    def test_save_and_load(self, chunks, tmp_path):
+        """Test that saved columns load back unchanged."""
+        columns = ChunkColumns.from_chunks(chunks)
+        file_path = str(tmp_path / "chunk_columns.bin")
+        columns.save(file_path)
+
+        loaded = ChunkColumns.load(file_path)
+        assert list(loaded.param_offsets) == list(columns.param_offsets)
+        for name in ChunkColumns._ENCODED_FIELDS:
+            assert getattr(loaded, name).decode() == getattr(columns, name).decode()
+        assert list(loaded.match(np.arange(4), param_type="int")) == list(
+            columns.match(np.arange(4), param_type="int")
+        )
+
+    def test_load_rejects_old_layout(self, tmp_path):
+        """Test that columns saved in an older layout are refused."""
+        file_path = str(tmp_path / "chunk_columns.bin")
+        with open(file_path, "wb") as f:
+            np.save(f, np.array(["function"]))
+
+        with pytest.raises(ValueError):
+            ChunkColumns.load(file_path)
+
+    def test_columns_store_each_distinct_value_once(self, chunks):
+        """Test that a long value does not widen the codes of other rows."""
+        long_type = "dict[str, " * 50 + "any" + "]" * 50
+        columns = ChunkColumns.from_chunks(chunks * 100)
+        columns.extend([{"type": "function", "return_type": long_type}])
+
+        assert len(columns) == 401
+        assert columns.return_types_lower.codes.dtype == np.int32
+        assert len(columns.return_types_lower.values) == 4
+        assert columns.types.values == ["function", "method", "section"]
+        assert columns.match(np.array([400]), return_type="dict[str, dict").all()
+
+    def test_incremental_extend_is_buffered(self, chunks):
+        """Test that appends are materialized once, when the columns are read."""
+        columns = ChunkColumns()
+        for chunk in chunks:
+            columns.extend([chunk])
+        assert len(columns.types._codes) == 0
+
+        assert list(columns.match(np.arange(4), type_filter="function")) == [
+            True,
+            False,
+            False,
+            True,
+        ]
+        assert len(columns.types._codes) == 4
+
+    def test_match_combined_filters(self, chunks):
+        """Test that combined signature filters must all hold."""
+        columns = ChunkColumns.from_chunks(chunks)
+        ids = np.arange(len(chunks))
+
+        assert list(
+            columns.match(ids, param_name="limit", param_type="int", return_type="dict")
+        ) == [True, False, False, False]
+        assert not columns.match(ids, param_name="self", return_type="dict").any()
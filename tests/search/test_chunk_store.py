@@ -0,0 +1,65 @@
+"""Tests for the memory-mapped chunk store."""
+
+import numpy as np
+import pytest
+from src.search.chunk_store import MappedChunks, ChunkSubset
+
+
+class TestMappedChunks:
+    """Test class for MappedChunks and ChunkSubset."""
+
+    @pytest.fixture
+    def chunks(self):
+        """Create sample chunks for testing."""
+        return [
+            {"type": "function", "content": "def foo(): pass", "content_type": "code"},
+            {"type": "section", "content": "Überblick", "content_type": "documentation"},
+            {"type": "class", "content": "class Bar: pass", "content_type": "code"},
+        ]
+
+    @pytest.fixture
+    def store(self, chunks, tmp_path):
+        """Write the sample chunks and open them as a mapped store."""
+        payload_path = str(tmp_path / "chunks.bin")
+        offsets_path = str(tmp_path / "chunk_offsets.npy")
+        MappedChunks.write(chunks, payload_path, offsets_path)
+        return MappedChunks(payload_path, offsets_path)
+
+    def test_round_trip(self, store, chunks):
+        """Test that written chunks are read back unchanged."""
+        assert len(store) == 3
+        assert list(store) == chunks
+        assert store[-1] == chunks[2]
+        assert store[1:] == chunks[1:]
+        with pytest.raises(IndexError):
+            store[3]
+
+    def test_extend(self, store, chunks):
+        """Test that chunks appended after loading are visible."""
+        extra = {"type": "function", "content": "def baz(): pass"}
+        store.extend([extra])
+
+        assert len(store) == 4
+        assert store[3] == extra
+        assert store[0] == chunks[0]
+
+    def test_empty_store(self, tmp_path):
+        """Test writing and opening a store without chunks."""
+        payload_path = str(tmp_path / "chunks.bin")
+        offsets_path = str(tmp_path / "chunk_offsets.npy")
+        MappedChunks.write([], payload_path, offsets_path)
+
+        store = MappedChunks(payload_path, offsets_path)
+        assert len(store) == 0
+        assert list(store) == []
+
+    def test_subset(self, store, chunks):
+        """Test viewing a subset of a store."""
+        subset = ChunkSubset(store, np.array([0, 2]))
+
+        assert len(subset) == 2
+        assert subset[1] == chunks[2]
+        assert subset[:] == [chunks[0], chunks[2]]
+
+        subset.extend([chunks[1]])
+        assert subset[-1] == chunks[1]
@@ -0,0 +1,34 @@
+"""Tests for the SQLite embedding cache."""
+
+import numpy as np
+import pytest
+from src.search.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """Test class for EmbeddingCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a small cache for testing."""
+        return EmbeddingCache(str(tmp_path / "embeddings.sqlite"), "model", 3)
+
+    def test_round_trip(self, cache):
+        """Test that stored embeddings are returned by hash."""
+        embeddings = np.arange(6, dtype=np.float32).reshape(2, 3)
+        cache.put_many(["a", "b"], embeddings)
+
+        found = cache.get_many(["a", "b", "c"])
+
+        assert set(found) == {"a", "b"}
+        np.testing.assert_array_equal(found["b"], embeddings[1])
+
+    def test_evicts_oldest_beyond_max_entries(self, cache):
+        """Test that the cache keeps only its max_entries newest embeddings."""
+        for text_hash in "abcd":
+            cache.put_many([text_hash], np.zeros((1, 3), dtype=np.float32))
+        # Storing an existing hash again refreshes it
+        cache.put_many(["b"], np.ones((1, 3), dtype=np.float32))
+        cache.put_many(["e"], np.zeros((1, 3), dtype=np.float32))
+
+        assert set(cache.get_many(list("abcde"))) == {"b", "d", "e"}
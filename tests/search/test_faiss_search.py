@@ -1,7 +1,6 @@
 """Tests for the FAISS search engine."""
 
 import os
-import tempfile
 import json
 import numpy as np
 import pytest
@@ -14,12 +13,13 @@ class TestFaissSearchEngine:
     """Test class for FaissSearchEngine."""
 
     @pytest.fixture
-    def search_engine(self):
+    def search_engine(self, temp_dir):
         """Create a FAISS search engine for testing."""
-        # Create with default parameters
-        with tempfile.TemporaryDirectory() as temp_dir:
-            engine = FaissSearchEngine(model_name="all-MiniLM-L6-v2", data_dir=temp_dir)
-            yield engine
+        # Create with default parameters, in a subdirectory so that tests can
+        # create other engines in temp_dir
+        return FaissSearchEngine(
+            model_name="all-MiniLM-L6-v2", data_dir=os.path.join(temp_dir, "engine")
+        )
 
     @pytest.fixture
     def chunks(self):
@@ -73,28 +73,27 @@ class TestFaissSearchEngine:
         search_engine.add_chunks(chunks)
         return search_engine
 
-    def test_initialization(self):
+    def test_initialization(self, temp_dir):
         """Test that the search engine initializes correctly."""
         # Create a temporary directory for the data_dir
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Test with default parameters
-            engine = FaissSearchEngine(data_dir=temp_dir)
-            assert engine.model_name == "all-MiniLM-L6-v2"  # Default model
-            assert engine.data_dir == temp_dir
-            # Note: use_gpu might be False even if requested to be True if hardware isn't available
-            # So we don't assert its value
-            assert engine.dimension > 0  # Model dimension should be positive
-            assert engine.index is not None  # Index should be initialized
-            assert len(engine.chunks) == 0  # No chunks added yet
-
-            # We can only assert that the custom model name is set, not the GPU usage
-            # since that depends on hardware availability
-            custom_engine = FaissSearchEngine(
-                model_name="paraphrase-MiniLM-L6-v2",
-                data_dir=temp_dir,
-            )
-            assert custom_engine.model_name == "paraphrase-MiniLM-L6-v2"
-            assert custom_engine.data_dir == temp_dir
+        # Test with default parameters
+        engine = FaissSearchEngine(data_dir=temp_dir)
+        assert engine.model_name == "all-MiniLM-L6-v2"  # Default model
+        assert engine.data_dir == temp_dir
+        # Note: use_gpu might be False even if requested to be True if hardware isn't available
+        # So we don't assert its value
+        assert engine.dimension > 0  # Model dimension should be positive
+        assert engine.index is not None  # Index should be initialized
+        assert len(engine.chunks) == 0  # No chunks added yet
+
+        # We can only assert that the custom model name is set, not the GPU usage
+        # since that depends on hardware availability
+        custom_engine = FaissSearchEngine(
+            model_name="paraphrase-MiniLM-L6-v2",
+            data_dir=temp_dir,
+        )
+        assert custom_engine.model_name == "paraphrase-MiniLM-L6-v2"
+        assert custom_engine.data_dir == temp_dir
 
     def test_add_chunks(self, search_engine, chunks):
         """Test adding chunks to the search engine."""
@@ -108,10 +107,10 @@ class TestFaissSearchEngine:
         assert len(search_engine.code_chunks) == 3  # 3 code chunks
         assert len(search_engine.doc_chunks) == 2  # 2 documentation chunks
 
-        # Verify indices were updated
+        # Verify the combined index was updated and positions were recorded
         assert search_engine.index.ntotal == len(chunks)
-        assert search_engine.code_index.ntotal == 3
-        assert search_engine.doc_index.ntotal == 2
+        assert len(search_engine.code_ids) == 3
+        assert len(search_engine.doc_ids) == 2
 
     def test_search(self, populated_engine):
         """Test searching for chunks."""
@@ -135,8 +134,10 @@ class TestFaissSearchEngine:
         )
 
         # Should only return code chunks
+        assert len(code_results) == 3
         for result in code_results:
             assert result["chunk"]["content_type"] == "code"
+            assert result["chunk_id"] in populated_engine.code_ids
 
         # Test with minimum score
         high_score_results = populated_engine.search("machine learning", min_score=0.9)
@@ -144,6 +145,52 @@ class TestFaissSearchEngine:
         # All results should have high scores
         assert all(result["score"] >= 0.9 for result in high_score_results)
 
+    def test_search_batch(self, populated_engine):
+        """Test that batched searches match one search per query."""
+        queries = ["machine learning", "data processing", "neural network"]
+
+        batch = populated_engine.search_batch(queries, top_k=2, content_filter="code")
+
+        assert len(batch) == len(queries)
+        for query, results in zip(queries, batch):
+            expected = populated_engine.search(query, top_k=2, content_filter="code")
+            assert [r["chunk_id"] for r in results] == [
+                r["chunk_id"] for r in expected
+            ]
+
+    def test_display_content_reused(self, populated_engine):
+        """Test that repeated searches reuse the formatted display content."""
+        expected = populated_engine.search("machine learning", top_k=2)
+
+        with patch.object(
+            populated_engine, "_get_display_content"
+        ) as mock_display_content:
+            results = populated_engine.search("machine learning", top_k=2)
+
+        mock_display_content.assert_not_called()
+        assert [r["content"] for r in results] == [r["content"] for r in expected]
+
+    def test_display_content_cache_is_bounded(self, populated_engine, chunks):
+        """Test that only the most recently returned display strings are kept."""
+        with patch.object(FaissSearchEngine, "DISPLAY_CACHE_SIZE", 2):
+            results = populated_engine.search("machine learning", top_k=len(chunks))
+
+        assert len(results) > 2
+        assert list(populated_engine._display_contents) == [
+            r["chunk_id"] for r in results[-2:]
+        ]
+
+    def test_filtered_search_without_selectors(self, populated_engine):
+        """Test the post-filtering path used for GPU indices."""
+        expected = populated_engine.search("machine learning", content_filter="code")
+
+        # The over-fetch path also works on a CPU index
+        populated_engine.use_gpu = True
+        results = populated_engine.search("machine learning", content_filter="code")
+
+        assert [r["chunk_id"] for r in results] == [r["chunk_id"] for r in expected]
+        assert all(r["chunk"]["content_type"] == "code" for r in results)
+
     @patch("faiss.write_index")
     @patch("os.makedirs")
     def test_build_and_save_index(
@@ -157,8 +204,8 @@ class TestFaissSearchEngine:
 
             populated_engine.build_index()
 
-            # Should have called write_index at least 3 times (main, code, doc indices)
-            assert mock_write_index.call_count >= 3
+            # Should have written the single combined index
+            assert mock_write_index.call_count == 1
 
             # Should have created the data directory
             mock_makedirs.assert_called_once_with(
@@ -188,10 +235,10 @@ class TestFaissSearchEngine:
             mock_read_index.return_value = mock_index
 
             # Call the load method
-            populated_engine._load_index()
+            populated_engine.load_index()
 
-            # Should have called read_index at least 3 times (main, code, doc indices)
-            assert mock_read_index.call_count >= 3
+            # Code and documentation searches filter the single combined index
+            assert mock_read_index.call_count == 1
 
     def test_get_text_for_embedding(self, search_engine, chunks):
         """Test the text extraction for embedding."""
@@ -266,3 +313,260 @@ class TestFaissSearchEngine:
             assert "chunk" in result
             assert "score" in result
             assert "content" in result
+
+    def test_build_index_writes_no_json_chunks(self, populated_engine):
+        """Test that chunks are only saved to the memory-mapped store."""
+        populated_engine.build_index()
+        data_dir = populated_engine.data_dir
+        assert os.path.getsize(os.path.join(data_dir, "chunks.bin")) > 0
+        assert not os.path.exists(os.path.join(data_dir, "chunks.json"))
+
+    def test_load_index_from_json_chunks(self, populated_engine, chunks):
+        """Test loading an older index whose chunks are only saved as JSON."""
+        populated_engine.build_index()
+        data_dir = populated_engine.data_dir
+        for filename in ("chunks.bin", "chunk_offsets.npy", "chunk_columns.bin"):
+            os.remove(os.path.join(data_dir, filename))
+        with open(os.path.join(data_dir, "chunks.json"), "w", encoding="utf-8") as f:
+            json.dump(chunks, f)
+
+        engine = FaissSearchEngine(
+            model_name="all-MiniLM-L6-v2", data_dir=populated_engine.data_dir
+        )
+        assert engine.load_index()
+        assert list(engine.chunks) == chunks
+        assert len(engine.code_chunks) == 3
+        assert len(engine.doc_chunks) == 2
+        results = engine.search("machine learning", content_filter="code")
+        assert all(r["chunk"]["content_type"] == "code" for r in results)
+
+    def test_load_index_with_old_columns_layout(self, populated_engine, chunks):
+        """Test that columns saved in an older layout are rebuilt from the store."""
+        populated_engine.build_index()
+        columns_file = os.path.join(populated_engine.data_dir, "chunk_columns.bin")
+        with open(columns_file, "wb") as f:
+            np.save(f, np.array(["documentation"]))
+
+        engine = FaissSearchEngine(data_dir=populated_engine.data_dir)
+        assert engine.load_index()
+        assert list(engine.code_ids) == list(populated_engine.code_ids)
+        assert list(engine.doc_ids) == list(populated_engine.doc_ids)
+
+    def test_rebuild_mapped_index(self, populated_engine, chunks):
+        """Test that an index loaded from mapped files can be extended and saved."""
+        populated_engine.build_index()
+
+        engine = FaissSearchEngine(
+            model_name="all-MiniLM-L6-v2", data_dir=populated_engine.data_dir
+        )
+        assert engine.load_index()
+        engine.add_chunks(chunks[:2])
+        engine.build_index()
+
+        reloaded = FaissSearchEngine(
+            model_name="all-MiniLM-L6-v2", data_dir=populated_engine.data_dir
+        )
+        assert reloaded.load_index()
+        assert reloaded.index.ntotal == len(chunks) + 2
+        np.testing.assert_allclose(
+            reloaded.index.reconstruct_n(0, len(chunks)),
+            populated_engine.index.reconstruct_n(0, len(chunks)),
+        )
+
+    def test_load_index_maps_vectors(self, populated_engine):
+        """Test that a loaded index reads its vectors from the mapped file."""
+        populated_engine.build_index()
+        index_file = os.path.join(populated_engine.data_dir, "faiss_index.bin")
+
+        engine = FaissSearchEngine(
+            model_name="all-MiniLM-L6-v2", data_dir=populated_engine.data_dir
+        )
+        assert engine.load_index()
+
+        # Overwrite the file in place with the same vectors in reverse order;
+        # only a mapped index sees the new data
+        vectors = populated_engine.index.reconstruct_n(0, populated_engine.index.ntotal)
+        reversed_index = faiss.IndexFlatIP(populated_engine.dimension)
+        reversed_index.add(np.ascontiguousarray(vectors[::-1]))
+        with open(index_file, "r+b") as f:
+            f.write(faiss.serialize_index(reversed_index).tobytes())
+
+        np.testing.assert_allclose(engine.index.reconstruct(0), vectors[-1])
+
+    def test_merge_into_mapped_index(self, populated_engine, chunks, temp_dir):
+        """Test that another engine can be merged into a loaded index."""
+        populated_engine.build_index()
+        engine = FaissSearchEngine(
+            model_name="all-MiniLM-L6-v2", data_dir=populated_engine.data_dir
+        )
+        assert engine.load_index()
+
+        other = FaissSearchEngine(
+            model_name="all-MiniLM-L6-v2", data_dir=os.path.join(temp_dir, "other")
+        )
+        other.add_chunks(chunks[:2])
+        engine.merge_from(other)
+
+        assert engine.index.ntotal == len(chunks) + 2
+        assert len(engine.chunks) == len(chunks) + 2
+
+    def test_reset(self, populated_engine, chunks):
+        """Test that reset empties the engine and deletes the saved index."""
+        populated_engine.build_index()
+        populated_engine.search("machine learning", content_filter="code")
+
+        populated_engine.reset()
+
+        assert len(populated_engine.chunks) == 0
+        assert len(populated_engine.code_chunks) == 0
+        assert len(populated_engine.columns) == 0
+        assert populated_engine.index.ntotal == 0
+        assert not os.path.exists(
+            os.path.join(populated_engine.data_dir, "index_metadata.json")
+        )
+        assert not populated_engine.load_index()
+
+        # The embedding cache is kept, so re-adding chunks does not re-encode
+        assert os.path.exists(
+            os.path.join(populated_engine.data_dir, "embeddings.sqlite")
+        )
+
+        # The engine can be filled again after a reset
+        with patch.object(populated_engine.model, "encode") as mock_encode:
+            populated_engine.add_chunks(chunks)
+        mock_encode.assert_not_called()
+        assert populated_engine.index.ntotal == len(chunks)
+        assert len(populated_engine.code_ids) == 3
+
+    def test_add_chunks_reuses_cached_embeddings(self, search_engine, chunks):
+        """Test that re-adding unchanged chunks does not re-encode them."""
+        search_engine.add_chunks(chunks)
+        expected = search_engine.index.reconstruct_n(0, len(chunks))
+
+        engine = FaissSearchEngine(
+            model_name="all-MiniLM-L6-v2", data_dir=search_engine.data_dir
+        )
+        with patch.object(engine.model, "encode") as mock_encode:
+            engine.add_chunks(chunks)
+
+        mock_encode.assert_not_called()
+        np.testing.assert_allclose(
+            engine.index.reconstruct_n(0, len(chunks)), expected
+        )
+
+    def test_embedding_cache_opened_lazily(self, populated_engine):
+        """Test that serving a saved index never creates the embedding cache."""
+        populated_engine.build_index()
+        cache_file = os.path.join(populated_engine.data_dir, "embeddings.sqlite")
+        os.remove(cache_file)
+
+        engine = FaissSearchEngine(data_dir=populated_engine.data_dir)
+        assert engine.load_index()
+        assert engine.search("machine learning")
+        assert not os.path.exists(cache_file)
+
+    @pytest.mark.parametrize("quantization", ["fp16", "int8"])
+    def test_quantized_index(self, chunks, quantization, temp_dir):
+        """Test that quantized indices rank like the float32 index."""
+        exact = FaissSearchEngine(data_dir=os.path.join(temp_dir, "exact"))
+        quantized = FaissSearchEngine(
+            data_dir=os.path.join(temp_dir, "quantized"),
+            quantization=quantization,
+        )
+        exact.add_chunks(chunks)
+        quantized.add_chunks(chunks)
+
+        assert isinstance(quantized.index, faiss.IndexScalarQuantizer)
+        expected = exact.search("machine learning", top_k=1)
+        results = quantized.search("machine learning", top_k=1)
+        assert results[0]["chunk_id"] == expected[0]["chunk_id"]
+        assert results[0]["score"] == pytest.approx(expected[0]["score"], abs=0.02)
+
+    @pytest.mark.parametrize("quantization", [None, "fp16", "int8"])
+    def test_hnsw_index(self, chunks, quantization, temp_dir):
+        """Test that HNSW indices find the same best match and survive reloading."""
+        exact = FaissSearchEngine(data_dir=os.path.join(temp_dir, "exact"))
+        hnsw_dir = os.path.join(temp_dir, "hnsw")
+        hnsw = FaissSearchEngine(
+            data_dir=hnsw_dir, quantization=quantization, index_type="hnsw"
+        )
+        exact.add_chunks(chunks)
+        hnsw.add_chunks(chunks)
+        hnsw.build_index()
+
+        assert isinstance(hnsw.index, faiss.IndexHNSW)
+        expected = exact.search("machine learning", top_k=1)
+        results = hnsw.search("machine learning", top_k=1)
+        assert results[0]["chunk_id"] == expected[0]["chunk_id"]
+
+        reloaded = FaissSearchEngine(data_dir=hnsw_dir, index_type="hnsw")
+        assert reloaded.load_index()
+        assert reloaded.index.hnsw.efSearch == FaissSearchEngine.HNSW_EF_SEARCH
+        results = reloaded.search("machine learning", top_k=1)
+        assert results[0]["chunk_id"] == expected[0]["chunk_id"]
+
+    def test_model_shared_between_engines(self, search_engine, temp_dir):
+        """Test that engines for the same model reuse the loaded model."""
+        other = FaissSearchEngine(
+            model_name=search_engine.model_name, data_dir=temp_dir
+        )
+        assert other.model is search_engine.model
+
+    def test_merge_from(self, populated_engine, chunks, temp_dir):
+        """Test that merging engines matches adding all chunks to one engine."""
+        code = FaissSearchEngine(data_dir=os.path.join(temp_dir, "code"))
+        docs = FaissSearchEngine(data_dir=os.path.join(temp_dir, "docs"))
+        merged = FaissSearchEngine(data_dir=os.path.join(temp_dir, "merged"))
+        code.add_chunks([c for c in chunks if c["content_type"] == "code"])
+        docs.add_chunks([c for c in chunks if c["content_type"] == "documentation"])
+
+        with patch.object(merged, "_embed_texts") as embed:
+            merged.merge_from(code)
+            merged.merge_from(docs)
+        embed.assert_not_called()
+
+        assert len(merged.chunks) == len(chunks)
+        assert merged.index.ntotal == len(chunks)
+        assert list(merged.code_ids) == [0, 1, 2]
+        assert list(merged.doc_ids) == [3, 4]
+        assert len(merged.columns) == len(chunks)
+
+        # Same scores per chunk; ties may come back in a different order
+        expected = populated_engine.search("machine learning", top_k=5)
+        results = merged.search("machine learning", top_k=5)
+        assert {r["chunk"]["id"]: r["score"] for r in results} == pytest.approx(
+            {r["chunk"]["id"]: r["score"] for r in expected}
+        )
+        results = merged.search("machine learning", content_filter="documentation")
+        assert all(r["chunk"]["content_type"] == "documentation" for r in results)
+
+    def test_merge_from_other_model(self, search_engine, temp_dir):
+        """Test that engines built with different models cannot be merged."""
+        other = FaissSearchEngine(data_dir=temp_dir)
+        other.model_name = "other-model"
+        with pytest.raises(ValueError):
+            search_engine.merge_from(other)
+
+    def test_invalid_index_type(self, temp_dir):
+        """Test that unknown index types are rejected."""
+        with pytest.raises(ValueError):
+            FaissSearchEngine(data_dir=temp_dir, index_type="ivfpq")
+
+    def test_invalid_quantization(self, temp_dir):
+        """Test that unknown quantization modes are rejected."""
+        with pytest.raises(ValueError):
+            FaissSearchEngine(data_dir=temp_dir, quantization="int4")
+
+    def test_encode_texts(self, search_engine):
+        """Test that texts are encoded in one model call, aligned with the texts."""
+        texts = [f"text number {i}" for i in range(10)]
+        expected = search_engine.model.encode(texts, normalize_embeddings=True)
+
+        with patch.object(
+            search_engine.model, "encode", wraps=search_engine.model.encode
+        ) as mock_encode:
+            embeddings = search_engine._encode_texts(texts)
+
+        mock_encode.assert_called_once()
+        assert embeddings.dtype == np.float32
+        np.testing.assert_allclose(embeddings, expected, rtol=1e-5, atol=1e-6)
@@ -1,38 +1,52 @@
 """Tests for the SearchEngine class."""
 
 import os
+import subprocess
+import sys
 import pytest
-import tempfile
+import numpy as np
+from unittest.mock import MagicMock
+from src.search.backend import SearchBackend
 from src.search.search_engine import SearchEngine
 
 
+def test_import_leaves_root_logger_alone():
+    """Test that importing the search engine does not configure logging."""
+    # Run in a fresh interpreter, since other tests have already imported it
+    code = (
+        "import logging\n"
+        "before = list(logging.getLogger().handlers)\n"
+        "import src.search.search_engine\n"
+        "assert logging.getLogger().handlers == before, logging.getLogger().handlers\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+
 class TestSearchEngine:
     """Test class for SearchEngine."""
 
-    @pytest.fixture
-    def temp_data_dir(self):
-        """Create a temporary directory for search engine data."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield tmpdir
-
-    def test_initialization(self, temp_data_dir):
+    def test_initialization(self, temp_dir):
         """Test that SearchEngine initializes properly."""
-        engine = SearchEngine(data_dir=temp_data_dir)
+        engine = SearchEngine(data_dir=temp_dir)
 
         # Check that the data directory is created
-        assert os.path.exists(temp_data_dir)
+        assert os.path.exists(temp_dir)
 
         # Check default model name
         assert engine.model_name is not None
         assert isinstance(engine.model_name, str)
 
+        # The backend must satisfy the SearchBackend protocol
+        assert isinstance(engine.backend, SearchBackend)
+
         # Test with custom model
-        engine = SearchEngine(model_name="all-MiniLM-L6-v2", data_dir=temp_data_dir)
+        engine = SearchEngine(model_name="all-MiniLM-L6-v2", data_dir=temp_dir)
         assert engine.model_name == "all-MiniLM-L6-v2"
 
-    def test_add_chunks(self, temp_data_dir):
+    def test_add_chunks(self, temp_dir):
         """Test adding chunks to the search engine."""
-        engine = SearchEngine(data_dir=temp_data_dir)
+        engine = SearchEngine(data_dir=temp_dir)
 
         # Create some test chunks
         chunks = [
@@ -58,9 +72,9 @@ class TestSearchEngine:
         # Since chunks might be stored in the search backend rather than directly
         # on the SearchEngine object, we just verify the method ran without errors
 
-    def test_build_and_save_index(self, temp_data_dir):
+    def test_build_and_save_index(self, temp_dir):
         """Test building and saving the search index."""
-        engine = SearchEngine(data_dir=temp_data_dir)
+        engine = SearchEngine(data_dir=temp_dir)
 
         # Create some test chunks
         chunks = [
@@ -85,17 +99,17 @@ class TestSearchEngine:
         engine.build_index()
 
         # Check that index files were created
-        assert os.path.exists(os.path.join(temp_data_dir, "chunks.json"))
+        assert os.path.exists(os.path.join(temp_dir, "chunks.bin"))
 
         # This conditional check allows the test to pass even if the specific
         # index format changes in the future
-        index_files = os.listdir(temp_data_dir)
-        assert len(index_files) >= 2  # At least chunks.json and one index file
+        index_files = os.listdir(temp_dir)
+        assert len(index_files) >= 2  # At least chunks.bin and one index file
 
-    def test_load_index(self, temp_data_dir):
+    def test_load_index(self, temp_dir):
         """Test loading a previously saved index."""
         # Create and save an index
-        engine1 = SearchEngine(data_dir=temp_data_dir)
+        engine1 = SearchEngine(data_dir=temp_dir)
         chunks = [
             {
                 "type": "function",
@@ -109,7 +123,7 @@ class TestSearchEngine:
         engine1.build_index()
 
         # Create a new engine instance and load the index
-        engine2 = SearchEngine(data_dir=temp_data_dir)
+        engine2 = SearchEngine(data_dir=temp_dir)
         success = engine2.load_index()
 
         # Check that the index was loaded successfully
@@ -118,3 +132,124 @@ class TestSearchEngine:
         # We can test that search works on the loaded index
         results = engine2.search("test function")
         assert isinstance(results, list)
+
+    def test_load(self, temp_dir):
+        """Test opening a saved index with the load classmethod."""
+        with pytest.raises(ValueError):
+            SearchEngine.load(temp_dir)
+
+        engine = SearchEngine(data_dir=temp_dir)
+        engine.bulk_index(
+            [{"type": "function", "name": "f", "docstring": "Adds numbers"}]
+        )
+
+        loaded = SearchEngine.load(temp_dir)
+        assert loaded.data_dir == temp_dir
+        assert len(loaded.backend.chunks) == 1
+        assert loaded.search("add numbers")[0]["chunk"]["name"] == "f"
+
+    def test_compile_signature_filter(self, temp_dir):
+        """Test that compiled signature filters match chunks by id."""
+        engine = SearchEngine(data_dir=temp_dir)
+        engine.add_chunks(
+            [
+                {
+                    "type": "function",
+                    "name": "load_data",
+                    "docstring": "Load data from a path",
+                    "params": [
+                        {"name": "path", "type": "str"},
+                        {"name": "limit", "type": "Optional[int]"},
+                    ],
+                    "return_type": "Dict[str, Any]",
+                    "content_type": "code",
+                },
+                {
+                    "type": "class",
+                    "name": "Loader",
+                    "docstring": "Loads data",
+                    "content_type": "code",
+                },
+            ]
+        )
+        function_id, class_id = 0, 1
+
+        ids = np.array([function_id, class_id])
+
+        matches = engine._compile_signature_filter(
+            {"param_type": "STR", "return_type": "dict"}
+        )
+        assert list(matches(ids)) == [True, False]
+
+        for signature_filter, expected in (
+            ({"param_name": "LIM"}, [True, False]),
+            ({"param_name": "offset"}, [False, False]),
+            ({"return_type": "list"}, [False, False]),
+        ):
+            matches = engine._compile_signature_filter(signature_filter)
+            assert list(matches(ids)) == expected
+
+    def test_filtered_search_uses_backend_protocol(self, temp_dir):
+        """Test that filtered searches only rely on SearchBackend methods."""
+        engine = SearchEngine(data_dir=temp_dir)
+        engine.backend = MagicMock(spec=SearchBackend)
+        engine.backend.search.return_value = [
+            {"chunk": {}, "chunk_id": i, "score": 1.0 - i / 10} for i in range(3)
+        ]
+        engine.backend.match_chunks.return_value = np.array([False, True, True])
+
+        results = engine.search("query", top_k=1, type_filter="function")
+
+        assert [r["chunk_id"] for r in results] == [1]
+        ids, kwargs = engine.backend.match_chunks.call_args
+        assert list(ids[0]) == [0, 1, 2]
+        assert kwargs == {"type_filter": "function"}
+
+    def test_search_without_filters(self, temp_dir):
+        """Test that unfiltered searches return backend results directly."""
+        engine = SearchEngine(data_dir=temp_dir)
+        backend_results = [{"chunk": {}, "chunk_id": 0, "score": 0.5}]
+        engine.backend.search = MagicMock(return_value=backend_results)
+
+        results = engine.search("query", top_k=2, content_filter="code")
+
+        assert results is backend_results
+        engine.backend.search.assert_called_once_with(
+            query="query", top_k=2, content_filter="code", min_score=0.0
+        )
+
+    @pytest.mark.parametrize("flush", [True, False])
+    def test_bulk_index(self, temp_dir, flush):
+        """Test that bulk indexing adds all chunks at once and saves on flush."""
+        engine = SearchEngine(data_dir=temp_dir)
+        engine.backend.add_chunks = MagicMock()
+        engine.backend.build_index = MagicMock()
+        chunks = [{"type": "function", "name": "f"}, {"type": "class", "name": "C"}]
+
+        engine.bulk_index(chunks, flush=flush)
+
+        engine.backend.add_chunks.assert_called_once_with(chunks)
+        assert engine.backend.build_index.call_count == int(flush)
+
+    def test_search_many(self, temp_dir):
+        """Test that batched searches match single searches, with filters."""
+        engine = SearchEngine(data_dir=temp_dir)
+        engine.bulk_index(
+            [
+                {"type": "function", "name": "add", "docstring": "Add numbers"},
+                {"type": "class", "name": "Adder", "docstring": "Adds numbers"},
+            ]
+        )
+        queries = ["add numbers", "adder class"]
+
+        for type_filter in (None, "class"):
+            batches = engine.search_many(queries, top_k=2, type_filter=type_filter)
+            assert batches == [
+                engine.search(query, top_k=2, type_filter=type_filter)
+                for query in queries
+            ]
+
+    def test_search_many_without_index(self, temp_dir):
+        """Test that batched searches return one empty list per query."""
+        engine = SearchEngine(data_dir=temp_dir)
+        assert engine.search_many(["a", "b"]) == [[], []]
@@ -1,50 +1,128 @@
-"""Integration tests for the code-cognitio system."""
+"""
+Integration tests for the code-cognitio system.
 
-import os
-import tempfile
+The module runs serially: under pytest-xdist every worker would reload the
+embedding model and rebuild every module-scoped engine, which costs more than
+the tests themselves. The fixtures still write to per-worker directories, so
+a parallel run stays correct.
+"""
+
+import re
 import pytest
+from pathlib import Path
 
 from src.extractors.code_extractor import CodeExtractor
 from src.extractors.doc_extractor import DocExtractor
 from src.processors.text_processor import TextProcessor
 from src.search.search_engine import SearchEngine
 
+# Tokens that must appear in the results of each kind of query
+_WORD_RE = re.compile(r"\w+")
+_FUNCTION_TOKENS = frozenset({"sample_function"})
+_INSTALL_TOKENS = frozenset({"pip", "install"})
+_SAMPLE_TOKENS = frozenset({"sample"})
+
+
+@pytest.fixture(scope="session")
+def python_chunks(temp_python_file):
+    """Extract the chunks of the sample Python file once per session."""
+    return CodeExtractor().extract_from_file(temp_python_file)
+
+
+@pytest.fixture(scope="session")
+def markdown_chunks(temp_markdown_file):
+    """Extract the chunks of the sample Markdown file once per session."""
+    return DocExtractor().extract_from_file(temp_markdown_file)
+
+
+@pytest.fixture(scope="session")
+def text_processor():
+    """Create a TextProcessor shared by the whole test session."""
+    return TextProcessor(use_spacy=False)  # Disable spaCy for testing
+
+
+@pytest.fixture(scope="session")
+def processed_python_chunks(text_processor, python_chunks):
+    """Process the sample Python chunks once per session."""
+    return text_processor.process_chunks(python_chunks)
+
+
+@pytest.fixture(scope="session")
+def processed_markdown_chunks(text_processor, markdown_chunks):
+    """Process the sample Markdown chunks once per session."""
+    return text_processor.process_chunks(markdown_chunks)
+
+
+@pytest.fixture(scope="module")
+def python_engine(tmp_path_factory, processed_python_chunks):
+    """Build a search index over the sample Python corpus."""
+    search_engine = SearchEngine(data_dir=str(tmp_path_factory.mktemp("python")))
+    search_engine.bulk_index(processed_python_chunks)
+    return search_engine
+
+
+@pytest.fixture(scope="module")
+def markdown_engine(tmp_path_factory, processed_markdown_chunks):
+    """Build a search index over the sample Markdown corpus."""
+    search_engine = SearchEngine(data_dir=str(tmp_path_factory.mktemp("markdown")))
+    search_engine.bulk_index(processed_markdown_chunks)
+    return search_engine
+
+
+@pytest.fixture(scope="module")
+def search_engine(tmp_path_factory, python_engine, markdown_engine):
+    """Merge the Python and Markdown indices without re-processing chunks."""
+    search_engine = SearchEngine(data_dir=str(tmp_path_factory.mktemp("mixed")))
+    search_engine.merge_from(python_engine)
+    search_engine.merge_from(markdown_engine)
+    search_engine.build_index()
+    return search_engine
+
+
+@pytest.fixture(scope="module")
+def loaded_engine(search_engine):
+    """Open the saved mixed index read-only, as a fresh process would."""
+    return SearchEngine.load(search_engine.data_dir)
+
 
 class TestIntegration:
     """Integration tests for the entire extraction, processing, and search pipeline."""
 
-    @pytest.fixture
-    def temp_data_dir(self):
-        """Create a temporary directory for test data."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield tmpdir
-
-    def test_end_to_end_python(self, temp_python_file, temp_data_dir):
-        """Test the end-to-end process with a Python file."""
-        # Extract chunks from the Python file
-        code_extractor = CodeExtractor()
-        chunks = code_extractor.extract_from_file(temp_python_file)
-
-        # Process the chunks
-        text_processor = TextProcessor(use_spacy=False)  # Disable spaCy for testing
-        processed_chunks = []
-        for chunk in chunks:
-            processed_chunk = text_processor.process_chunk(chunk)
-            processed_chunks.append(processed_chunk)
-
-        # Build a search index
-        search_engine = SearchEngine(data_dir=temp_data_dir)
-        search_engine.add_chunks(processed_chunks)
-        search_engine.build_index()
-
-        # Verify index was created
-        assert os.path.exists(os.path.join(temp_data_dir, "chunks.json"))
-
-        # Test simple search
-        results = search_engine.search("sample function")
-        assert len(results) > 0
-
-        # Check that we get some results
+    @pytest.mark.parametrize(
+        "engine", ["python_engine", "markdown_engine", "search_engine"]
+    )
+    def test_index_saved(self, request, engine):
+        """Test that building the index writes it to the data directory."""
+        search_engine = request.getfixturevalue(engine)
+        assert (Path(search_engine.data_dir) / "chunks.bin").stat().st_size > 0
+
+    @pytest.mark.parametrize(
+        "engine, content_filter, query, required_tokens",
+        [
+            ("python_engine", None, "sample function", _FUNCTION_TOKENS),
+            ("markdown_engine", None, "install package", _INSTALL_TOKENS),
+            ("search_engine", "code", "sample function", _FUNCTION_TOKENS),
+            ("search_engine", "documentation", "install package", _INSTALL_TOKENS),
+            ("search_engine", None, "sample", _SAMPLE_TOKENS),
+            ("loaded_engine", "code", "sample function", _FUNCTION_TOKENS),
+            ("loaded_engine", "documentation", "install package", _INSTALL_TOKENS),
+            ("loaded_engine", None, "sample", _SAMPLE_TOKENS),
+        ],
+        ids=[
+            "python",
+            "markdown",
+            "mixed-code",
+            "mixed-docs",
+            "mixed",
+            "loaded-code",
+            "loaded-docs",
+            "loaded",
+        ],
+    )
+    def test_end_to_end(self, request, engine, content_filter, query, required_tokens):
+        """Test searching each index, optionally within one content type."""
+        search_engine = request.getfixturevalue(engine)
+        results = search_engine.search(query, content_filter=content_filter)
         assert isinstance(results, list)
         assert len(results) > 0
 
@@ -52,73 +130,26 @@ class TestIntegration:
         for result in results:
             assert "chunk" in result
             assert "score" in result
-
-    def test_end_to_end_markdown(self, temp_markdown_file, temp_data_dir):
-        """Test the end-to-end process with a Markdown file."""
-        # Extract chunks from the Markdown file
-        doc_extractor = DocExtractor()
-        chunks = doc_extractor.extract_from_file(temp_markdown_file)
-
-        # Process the chunks
-        text_processor = TextProcessor(use_spacy=False)  # Disable spaCy for testing
-        processed_chunks = []
-        for chunk in chunks:
-            processed_chunk = text_processor.process_chunk(chunk)
-            processed_chunks.append(processed_chunk)
-
-        # Build a search index
-        search_engine = SearchEngine(data_dir=temp_data_dir)
-        search_engine.add_chunks(processed_chunks)
-        search_engine.build_index()
-
-        # Verify index was created
-        assert os.path.exists(os.path.join(temp_data_dir, "chunks.json"))
-
-        # Test searching for installation instructions
-        results = search_engine.search("install package")
-        assert len(results) > 0
-
-        # Verify we get results with the expected content
-        found_install_section = False
-        for result in results:
-            chunk = result["chunk"]
-            content = result.get("content", "")
-            if "pip install" in content or (
-                chunk.get("content") and "pip install" in chunk.get("content", "")
-            ):
-                found_install_section = True
-                break
-
-        assert found_install_section
-
-    def test_mixed_content_indexing(
-        self, temp_python_file, temp_markdown_file, temp_data_dir
-    ):
-        """Test indexing and searching across different content types."""
-        # Extract chunks from both files
-        code_extractor = CodeExtractor()
-        doc_extractor = DocExtractor()
-
-        code_chunks = code_extractor.extract_from_file(temp_python_file)
-        doc_chunks = doc_extractor.extract_from_file(temp_markdown_file)
-
-        # Process all chunks
-        text_processor = TextProcessor(use_spacy=False)
-        processed_chunks = []
-
-        for chunk in code_chunks + doc_chunks:
-            processed_chunk = text_processor.process_chunk(chunk)
-            processed_chunks.append(processed_chunk)
-
-        # Build a search index
-        search_engine = SearchEngine(data_dir=temp_data_dir)
-        search_engine.add_chunks(processed_chunks)
-        search_engine.build_index()
-
-        # Test search across content types
-        results = search_engine.search("sample")
-        assert len(results) > 0
-
-        # Basic validation of search functionality
-        assert isinstance(results, list)
-        assert len(results) > 0
+            if content_filter is not None:
+                assert result["chunk"]["content_type"] == content_filter
+
+        # Verify we get results with the expected tokens, either in the
+        # displayed content or in the raw chunk content
+        contents = "\n".join(
+            f"{result.get('content', '')}\n{result['chunk'].get('content') or ''}"
+            for result in results
+        )
+        assert required_tokens <= set(_WORD_RE.findall(contents.lower()))
+
+    def test_search_many(self, loaded_engine):
+        """Test that one batched search answers every query like single searches."""
+        queries = ["sample function", "install package", "sample"]
+        function_results, install_results, sample_results = loaded_engine.search_many(
+            queries
+        )
+
+        assert [function_results, install_results, sample_results] == [
+            loaded_engine.search(query) for query in queries
+        ]
+        assert all(len(results) > 0 for results in (function_results, sample_results))
+        assert any("pip install" in result["content"] for result in install_results)